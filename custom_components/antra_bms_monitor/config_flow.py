@@ -40,24 +40,35 @@ class AntraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._ports = []
 
-    async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
-        """Handle the initial step."""
-        errors = {}
-
-        # Get available ports
-        ports = []
+    async def _async_update_ports(self) -> bool:
+        """Enumerate the serial ports into self._ports, returning False on failure."""
         try:
             ports = await self.hass.async_add_executor_job(
                 serial.tools.list_ports.comports
             )
-            self._ports = [port.device for port in ports]
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error getting serial ports")
-            errors["base"] = "cannot_get_ports"
             self._ports = []
+            return False
+        self._ports = [port.device for port in ports]
+        return True
+
+    async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Handle the initial step."""
+        errors = {}
+
+        # Get available ports. The list is kept between form submissions and
+        # only re-read when the form is first shown or no ports were found.
+        refreshed = user_input is None or not self._ports
+        if refreshed and not await self._async_update_ports():
+            errors["base"] = "cannot_get_ports"
 
         if user_input is not None:
-            # Validate port
+            # Validate port, re-reading the list once in case the device
+            # was plugged in after the form was shown
+            if user_input[CONF_PORT] not in self._ports and not refreshed:
+                if not await self._async_update_ports():
+                    errors["base"] = "cannot_get_ports"
             if user_input[CONF_PORT] not in self._ports:
                 errors[CONF_PORT] = "invalid_port"
             
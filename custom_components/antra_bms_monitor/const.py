@@ -6,4 +6,8 @@ CONF_BAUD_RATE = "baud_rate"
 CONF_MAX_BATTERIES = "max_batteries"
 DEFAULT_BAUD_RATE = 9600
 DEFAULT_MAX_BATTERIES = 4
-PLATFORMS = ["sensor"]
\ No newline at end of file
+PLATFORMS = ["sensor"]
+
+# Sensors with a publish threshold skip state writes for smaller changes,
+# but always publish at least this often (seconds)
+PUBLISH_MAX_INTERVAL = 300
@@ -3,42 +3,341 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import struct
 from datetime import timedelta
-from typing import Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, NamedTuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.exceptions import ConfigEntryNotReady
 
 _LOGGER = logging.getLogger(__name__)
 
-def convert_signed(decoded: str, pos: int, length: int, scale: float = 1.0) -> float:
-    """
-    Extracts a substring from the decoded hex string starting at 'pos' with 'length' hex digits,
-    converts it to an integer, and returns its signed value (using two's complement).
-    The result is divided by 'scale' (default 1.0) to allow for unit conversion.
+def frame_checksum(data: bytes) -> int:
+    """Return the frame checksum of data (the ASCII characters between SOI and CHKSUM).
 
+    The ASCII values are summed, taken modulo 65536, inverted and incremented.
+    """
+    return ((sum(data) % 65536) ^ 0xFFFF) + 1
+
+@lru_cache(maxsize=1024)
+def decode_bitmask(bitmask: int, total_cells: int = 16) -> str:
+    """Decode a bitmask integer into a comma-separated list of flagged cell numbers."""
+    # No flagged cells is the normal case for a healthy battery
+    if not bitmask:
+        return ""
+    flagged_cells = []
+    remaining = bitmask & ((1 << total_cells) - 1)
+    # Visit only the set bits, lowest first
+    while remaining:
+        lowest = remaining & -remaining
+        flagged_cells.append(str(lowest.bit_length()))
+        remaining ^= lowest
+    return ", ".join(flagged_cells)
+
+def decode_status_bitmask(bitmask: int, mapping: tuple) -> str:
+    """
+    Decode a status bitmask using the provided mapping.
+    
     Args:
-    decoded (str): The full hex string containing the data.
-    pos (int): The starting position in the string.
-    length (int): The number of hex digits to process (e.g., 4 for a 2-byte field).
-    scale (float): A scaling factor to divide the value by (default 1.0).
-
+        bitmask: The raw bitmask as an integer.
+        mapping: A tuple of status labels indexed by bit position (None for
+                 unused bits), as built by mapping_to_labels().
+                 
     Returns:
-        float: The signed and scaled value.
+        A comma-separated string of status labels for each bit that is set.
+    """
+    if not bitmask:
+        return ""
+    statuses = []
+    remaining = bitmask & ((1 << len(mapping)) - 1)
+    # Visit only the set bits, lowest first
+    while remaining:
+        lowest = remaining & -remaining
+        label = mapping[lowest.bit_length() - 1]
+        if label:
+            statuses.append(label)
+        remaining ^= lowest
+    return ", ".join(statuses)
+
+def mapping_to_labels(mapping: dict, bits: int = 16) -> tuple:
+    """Turn a {bit position: label} mapping into a tuple of labels indexed by bit."""
+    return tuple(mapping.get(bit) for bit in range(bits))
+
+class _StatusDecoder:
+    """Decode one kind of status word, remembering the result for each bitmask."""
+
+    __slots__ = ("labels", "_decoded")
+
+    def __init__(self, mapping: dict, bits: int = 16) -> None:
+        """Build the per-bit label table for the mapping."""
+        self.labels = mapping_to_labels(mapping, bits)
+        # At most 2**bits entries; in practice only a handful of words are seen
+        self._decoded: dict[int, str] = {}
+
+    def __call__(self, bitmask: int) -> str:
+        """Return the comma-separated labels for the bits set in bitmask."""
+        try:
+            return self._decoded[bitmask]
+        except KeyError:
+            decoded = self._decoded[bitmask] = decode_status_bitmask(bitmask, self.labels)
+            return decoded
+
+# Voltage status mapping:
+voltage_status_mapping = {
+    0: "Cell Overvoltage Protection",     # B0
+    1: "Cell Undervoltage Protection",     # B1
+    2: "Pack Overvoltage Protection",        # B2
+    3: "Pack Undervoltage Protection",       # B3
+    4: "Cell Overvoltage Alarm",             # B4
+    5: "Cell Undervoltage Alarm",            # B5
+    6: "Pack Overvoltage Alarm",             # B6
+    7: "Pack Undervoltage Alarm",            # B7
+    8: "Cell Voltage Difference Alarm",      # B8
+    15: "System Sleep"                       # B15
+}
+
+# Current status mapping:
+current_status_mapping = {
+    0: "Charging",                           # B0
+    1: "Discharging",                        # B1
+    2: "Charge Overcurrent Protection",      # B2
+    3: "Short Circuit Protection",           # B3
+    4: "Discharge Overcurrent 1 Protection",   # B4
+    5: "Discharge Overcurrent 2 Protection",   # B5
+    6: "Charge Overcurrent Alarm",           # B6
+    7: "Discharge Overcurrent Alarm"         # B7
+}
+
+# Mapping for Temperature Status (each bit position corresponds to a specific temperature protection/alarm)
+temperature_status_mapping = {
+    0: "Charge Over Temperature Protection",    # B0
+    1: "Charge Under Temperature Protection",    # B1
+    2: "Discharge Over Temperature Protection",  # B2
+    3: "Discharge Under Temperature Protection", # B3
+    4: "Ambient Over Temperature Protection",    # B4
+    5: "Ambient Under Temperature Protection",   # B5
+    6: "MOS Over Temperature Protection",        # B6
+    7: "MOS Under Temperature Protection",       # B7
+    8: "Charge Over Temperature Alarm",          # B8
+    9: "Charge Under Temperature Alarm",         # B9
+    10: "Discharge Over Temperature Alarm",       # B10
+    11: "Discharge Under Temperature Alarm",      # B11
+    12: "Ambient Over Temperature Alarm",         # B12
+    13: "Ambient Under Temperature Alarm",        # B13
+    14: "MOS Over Temperature Alarm",             # B14
+    15: "MOS Under Temperature Alarm",            # B15
+}
+
+# Mapping for Alarm Status
+alarm_status_mapping = {
+    0: "Cell Voltage Differential Alarm",  # B0
+    1: "Charge MOS Damage Alarm",            # B1
+    2: "External SD Card Failure Alarm",     # B2
+    3: "SPI Communication Failure Alarm",    # B3
+    4: "EEPROM Failure Alarm",               # B4
+    5: "LED Alarm Enable",                   # B5
+    6: "Buzzer Alarm Enable",                # B6
+    7: "Low Battery Alarm",                  # B7
+    8: "MOS Over Temperature Protection",    # B8
+    9: "MOS Over Temperature Alarm",         # B9
+    10: "Current Limiting Board Failure",    # B10
+    11: "Sampling Failure",                  # B11
+    12: "Battery Failure",                   # B12
+    13: "NTC Failure",                       # B13
+    14: "Charge MOS Failure",                # B14
+    15: "Discharge MOS Failure",             # B15
+}
+
+# FET status bits 0-3: (mask, label when set, label when clear or None)
+_FET_STATE_BITS = (
+    (1 << 0, "Charge MOS: On", "Charge MOS: Off"),
+    (1 << 1, "Disharge MOS: On", "Disharge MOS: Off"),
+    (1 << 2, "Discharge MOS Failure", None),
+    (1 << 3, "Charge MOS Failure", None),
+)
+
+# FET status bits 4-5: current limiting mode, indexed by the field value
+_FET_CURRENT_LIMITS = (
+    "No current limit",
+    "Current limit 5A",
+    "Current limit 10A",
+    "Current limit 25A",
+)
+
+# FET status flags after the current limiting field: (mask, label when set)
+_FET_FLAG_BITS = (
+    (1 << 11, "LED alarm enabled"),
+    (1 << 12, "Beep enabled"),
+)
+
+@lru_cache(maxsize=1024)
+def decode_fet_status(bitmask: int) -> str:
     """
-    # Convert the specified substring to an integer.
-    raw = int(decoded[pos:pos+length], 16)
-    # Calculate the number of bits in the field (each hex digit is 4 bits).
-    bits = length * 4
-    # The sign bit is at position bits-1.
-    sign_bit = 1 << (bits - 1)
-    # If the raw value is greater than or equal to the sign bit,
-    # subtract the full range (1 << bits) to get the negative value.
-    if raw >= sign_bit:
-        raw -= 1 << bits
-    # Return the (possibly signed) value divided by the scaling factor.
-    return raw / scale
+    Decode FET Status bitmask into a comma-separated string.
+    
+    Bit assignments:
+      - Bit 0: Charge MOS status (1 = on, 0 = off)
+      - Bit 1: Disharge MOS status (1 = on, 0 = off)
+      - Bit 2: Discharge MOS failure (1 = damaged)
+      - Bit 3: Charge MOS failure (assumed; 1 = damaged)
+      - Bits 4-5: Current limiting mode:
+           00: No current limit
+           01: Current limit 5A
+           10: Current limit 10A
+           11: Current limit 25A
+      - Bits 6-10: Reserved (ignored)
+      - Bit 11: LED alarm enable (1 = enabled)
+      - Bit 12: Beep enable (1 = enabled)
+      - Bits 13-15: Reserved (ignored)
+    """
+    statuses = []
+    for mask, on_label, off_label in _FET_STATE_BITS:
+        label = on_label if bitmask & mask else off_label
+        if label:
+            statuses.append(label)
+    # Bits 4-5: Current limiting mode (always decode)
+    statuses.append(_FET_CURRENT_LIMITS[(bitmask >> 4) & 0b11])
+    # Bits 6-10 and 13-15 are reserved; ignore.
+    statuses.extend(label for mask, label in _FET_FLAG_BITS if bitmask & mask)
+    return ", ".join(statuses)
+
+class StatusDef(NamedTuple):
+    """A status word and the decoder for its bits."""
+
+    key: str
+    decode: _StatusDecoder
+
+
+# Status words decoded by the coordinator. Each decoder keeps the labels of
+# the bitmasks it has already seen, so repeated words are a dict lookup.
+# FET status has its own multi-bit format and is decoded separately.
+STATUS_MAPPINGS = (
+    StatusDef("voltage", _StatusDecoder(voltage_status_mapping)),
+    StatusDef("current", _StatusDecoder(current_status_mapping)),
+    StatusDef("temperature", _StatusDecoder(temperature_status_mapping)),
+    StatusDef("alarm", _StatusDecoder(alarm_status_mapping)),
+)
+
+# Response return codes (RTN, sent in the CID2 position of a response)
+RTN_CODES = {
+    "00": "Normal",
+    "01": "VER error",
+    "02": "CHKSUM error",
+    "03": "LCHKSUM error",
+    "04": "CID2 invalidation",
+    "05": "Command format error",
+    "06": "Invalid data",
+    "90": "ADR error",
+    "91": "Communication error",
+}
+
+# Seconds between commands: the protocol minimum is 850ms, plus a margin for
+# timer and serial driver jitter
+_COMMAND_SPACING = 0.9
+
+# System header block (33 bytes), big-endian ('h' fields are signed): voltage,
+# current, total/remaining capacity, SOC, max/min ambient temp, max/min cell
+# voltage, 2 unused bytes, pack temperature, alarm status, 7 reserved bytes,
+# current status, battery count
+_HEADER = struct.Struct(">HhHHHhhHH2xhH7xBB")
+
+# Battery block parts, big-endian ('h' fields are signed).
+# Battery number, reserved byte, SOC, pack voltage, cell count
+_BATTERY_HEAD = struct.Struct(">BxBHB")
+# Ambient, pack average and MOS temperature, pack temp sensor count
+_BATTERY_TEMPS_FORMAT = "hhhB"
+# Everything after the pack temperature sensors: current, internal resistance,
+# SOH, user defined number, full/remaining capacity, cycles, max/min cell
+# voltage, max/min cell temp, unknown 3/4, average cell temp, average cell
+# voltage, total charge/discharge, then the ten status and protection words
+_BATTERY_TAIL_FORMAT = "hHHBHHHHHhhHHhHHH10H"
+
+
+# Header fields handed to the group sensors, in frame order (hex digit positions)
+_GROUP_KEYS = (
+    "voltage",  # 0-3 System average voltage
+    "current",  # 4-7 System total current
+    "total_capacity",  # 8-11
+    "remaining_capacity",  # 12-15
+    "soc",  # 16-19 System SOC
+    "max_ambient_temp",  # 20-23
+    "min_ambient_temp",  # 24-27
+    "max_cell_voltage",  # 28-31
+    "min_cell_voltage",  # 32-35
+    "alarm_status",  # 36-39 Alarm status bits
+    "pack_temperature",  # 40-43 Pack temperature
+    "reserved",  # 44-61 Reserved bytes stored as hex
+    "current_status",  # 62-63 Current status bits
+    "battery_count",  # 64-65
+)
+_GROUP_VALUES = itemgetter(*_GROUP_KEYS)
+
+# Battery fields handed to the battery sensors as (sensor key, parsed key)
+_BATTERY_FIELDS = (
+    # Basic Info (0-9)
+    ("number", "number"),  # Battery header (0-3)
+    ("soc", "soc"),  # SOC (4–5)
+    ("voltage", "voltage"),  # Pack Voltage (6–9)
+    ("cell_count", "cell_count"),  # Number of cells
+    # Cell Data (10-73)
+    ("cell_voltages", "cells"),  # List of cell voltages (each as a float)
+    # Temperature Data (74-91)
+    ("temp_count", "pack_temp_sensor_count"),  # Number of temperature sensors
+    ("temperatures", "pack_temperatures"),  # List of sensor temperatures
+    # Individual Temperature Sensors
+    ("ambient_temperature", "ambient_temperature"),
+    ("pack_avg_temperature", "pack_avg_temperature"),
+    ("mos_temperature", "mos_temperature"),
+    # Current and Resistance (92-99)
+    ("current", "current"),  # Charging/Discharging Current
+    ("internal_resistance", "internal_resistance"),
+    # Battery Health (100-105)
+    ("soh", "soh"),  # State of Health
+    ("user_defined", "user_defined"),
+    # Capacity Info (106-117)
+    ("full_capacity", "full_charge_capacity"),
+    ("remaining_capacity", "remaining_capacity"),
+    ("cycle_count", "cycle_count"),
+    # New Descriptive Fields (extracted by the parser)
+    ("max_cell_voltage", "max_cell_voltage"),
+    ("min_cell_voltage", "min_cell_voltage"),
+    ("average_cell_voltage", "average_cell_voltage"),
+    ("total_charge", "total_charge"),
+    ("total_discharge", "total_discharge"),
+    # Unknown Fields
+    ("max_cell_temp", "max_cell_temp"),
+    ("min_cell_temp", "min_cell_temp"),
+    ("unknown_3", "unknown_3"),
+    ("unknown_4", "unknown_4"),
+    ("avg_cell_temp", "avg_cell_temp"),
+)
+_BATTERY_KEYS = tuple(key for key, _ in _BATTERY_FIELDS)
+_BATTERY_VALUES = itemgetter(*(parsed_key for _, parsed_key in _BATTERY_FIELDS))
+
+# Status words (keyed like STATUS_MAPPINGS plus "fet") and protection bitmasks
+_STATUS_KEYS = ("voltage", "current", "temperature", "alarm", "fet")
+_STATUS_VALUES = itemgetter(
+    "voltage_status", "current_status", "temperature_status", "alarm_status", "fet_status"
+)
+_PROTECTION_KEYS = (
+    "overvoltage_protect", "undervoltage_protect", "overvoltage_alarm",
+    "undervoltage_alarm", "balance_status",
+)
+_PROTECTION_VALUES = itemgetter(*_PROTECTION_KEYS)
+
+
+@lru_cache(maxsize=32)
+def battery_block_struct(cell_count: int, temp_sensor_count: int) -> struct.Struct:
+    """Return the struct for a whole battery block with the given cell and pack temp sensor counts."""
+    return struct.Struct(
+        f"{_BATTERY_HEAD.format}{cell_count}H{_BATTERY_TEMPS_FORMAT}"
+        f"{temp_sensor_count}h{_BATTERY_TAIL_FORMAT}"
+    )
+
+# Standard battery block: 16 cells and 4 pack temperature sensors (106 bytes)
+_STANDARD_BATTERY_BLOCK_SIZE = battery_block_struct(16, 4).size
 
 class AntraDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Antra data."""
@@ -65,6 +364,14 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         self._group_number = group_number
         self._lock = asyncio.Lock()
         self.data = {}
+        # Bit n is set when battery n (1-based) is present in self.data
+        self.available_mask = 0
+        # Command frames already built, keyed by (command, battery_number)
+        self._command_cache: dict[tuple[bytes, int | None], bytes] = {}
+        # Last frame parsed into self.data
+        self._last_response: bytes | None = None
+        # Event loop time the previous command was sent, for command spacing
+        self._last_command_time = 0.0
         self.protocol_version = None
         _LOGGER.debug(
             "Initialized AntraDataCoordinator (group=%d, batteries=%d)", 
@@ -97,66 +404,24 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         position = battery_number
         return position + (0x10 * self._group_number)
 
-    def _verify_known_checksum(self):
-        """Verify checksum calculation against known working command."""
-        # Known working command: ~22004A42E002FFFCFE
-        data = "22004A42E002FF"
-        sum_val = sum(ord(c) for c in data)
-        _LOGGER.debug("Known command checksum calculation:")
-        _LOGGER.debug("  Data to sum: %s", data)
-        _LOGGER.debug("  Sum: %04X", sum_val)
-        remainder = sum_val % 65536
-        _LOGGER.debug("  Remainder (mod 65536): %04X", remainder)
-        expected = (remainder ^ 0xFFFF) + 1
-        _LOGGER.debug("  Calculated checksum: %04X (Command has FCFE)", expected)
-        return expected
-
-    def _build_command(self, 
-        command: bytes, 
-        battery_number: int | None = None, 
-        info_byte: bytes | None = None
-    ) -> bytes:
+    def _build_command(self, command: bytes, battery_number: int | None = None) -> bytes:
         """Build a command packet according to protocol."""
-        # First verify known checksum
-        #self._verify_known_checksum()
-
-        frame = bytearray()
-        frame.append(0x7E)  # SOI
-        frame.extend(b"22")  # VER
-        
-        # Calculate and add address
+        # Calculate the address
         address = self._calculate_address(battery_number)
-        frame.extend(f"{address:02X}".encode())
-        
-        frame.extend(b"4A")  # CID1
-        frame.extend(command)  # CID2
         
-        # For most commands, info matches address
-        # For system queries, info is 0xFF
-        if info_byte is None:
-            info_byte = b"FF" if battery_number is None else f"{address:02X}".encode()
-        info_byte = b"FF"
-            
-        frame.extend(b"E002")  # LENGTH
-        frame.extend(info_byte)  # INFO
-
-        # Show data being checksummed
-        data_to_sum = frame[1:].decode('ascii')  # Everything after SOI
-        #_LOGGER.debug("Our command checksum calculation:")
-        #_LOGGER.debug("  Data to sum: %s", data_to_sum)
-        sum_val = sum(ord(c) for c in data_to_sum)
-        #_LOGGER.debug("  Sum: %04X", sum_val)
-        remainder = sum_val % 65536
-        #_LOGGER.debug("  Remainder (mod 65536): %04X", remainder)
-        checksum = (remainder ^ 0xFFFF) + 1
-        #_LOGGER.debug("  Calculated checksum: %04X", checksum)
+        # VER, ADR, CID1, CID2, LENGTH and INFO (always 0xFF) in one go
+        body = b"22%02X4A%sE002FF" % (address, command)
+
+        # Checksum over everything after SOI
+        checksum = frame_checksum(body)
         
-        frame.extend(f"{checksum:04X}".encode())
-        frame.append(0x0D)  # EOI
+        # SOI, body, CHKSUM and EOI
+        frame = b"~%s%04X\r" % (body, checksum)
 
         # Show full command
-        _LOGGER.debug("Full command: %s", frame.hex())
-        return bytes(frame)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Full command: %s", frame.hex())
+        return frame
     
     def _format_message(self, data: bytes) -> str:
         """Convert ASCII hex bytes to hex string format.
@@ -164,32 +429,12 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         """
         try:
             # Skip SOI and CR
-            hex_str = data[1:-1].decode('ascii')
-            formatted = [int(hex_str[i:i+2], 16) for i in range(0, len(hex_str), 2)]
-            return '~' + ''.join(f'{b:02X}' for b in formatted)
+            return '~' + data[1:-1].decode('ascii').upper()
         except Exception as err:
             _LOGGER.error("Error formatting message: %s (data: %s)", err, data.hex())
             return f"~ERROR({data.hex()})"
 
-    def _get_battery_address(self, response: bytes) -> int | None:
-        """Get battery address from response."""
-        try:
-            # Convert ascii hex to int, position 2-3 contains address
-            hex_str = response[1:-1].decode('ascii')
-            return int(hex_str[2:4], 16)
-        except Exception as err:
-            _LOGGER.debug("Could not get battery address: %s", err)
-            return None
-
-    def _is_42h_response(self, response: bytes) -> bool:
-        """Check if this is a 42h response."""
-        try:
-            hex_str = response[1:-1].decode('ascii')
-            return len(hex_str) > 6 and hex_str[4:6] == "42"
-        except Exception:
-            return False
-
-    def _verify_checksum(self, data: bytes) -> bool:
+    def _verify_checksum(self, response: bytes) -> bool:
         """Verify message checksum.
         Format: ~...XXXX\r where XXXX is the checksum in hex.
         
@@ -197,22 +442,18 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         Take modulus 65536 of sum, invert and add 1.
         """
         try:
-            # Get ASCII data without SOI, CHKSUM and EOI
-            hex_str = data[1:-1].decode('ascii')
-            data_str = hex_str[:-4]  # Remove checksum
-            msg_checksum = int(hex_str[-4:], 16)
+            data = response[1:-5]  # Remove SOI, checksum and EOI
+            msg_checksum = int(response[-5:-1], 16)
             
-            # Sum ASCII values of data characters
-            sum_val = sum(ord(c) for c in data_str)
-            _LOGGER.debug("Checksum calculation: sum=%04X", sum_val)
-            
-            remainder = sum_val % 65536
-            expected = (remainder ^ 0xFFFF) + 1
+            # Sum ASCII values of data characters straight from the raw bytes
+            expected = frame_checksum(data)
             
             if msg_checksum != expected:
+                sum_val = sum(data)
+                remainder = sum_val % 65536
                 _LOGGER.debug(
                     "Checksum details: data='%s', sum=%04X, mod=%04X, expected=%04X, got=%04X", 
-                    data_str,
+                    data.decode('ascii', errors='replace'),
                     sum_val,
                     remainder,
                     expected,
@@ -228,30 +469,19 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         
     def _get_rtn_description(self, rtn: str) -> str:
         """Get description of return code."""
-        rtn_codes = {
-            "00": "Normal",
-            "01": "VER error",
-            "02": "CHKSUM error",
-            "03": "LCHKSUM error",
-            "04": "CID2 invalidation",
-            "05": "Command format error",
-            "06": "Invalid data",
-            "90": "ADR error",
-            "91": "Communication error"
-        }
-        return rtn_codes.get(rtn, "Unknown RTN code")
+        return RTN_CODES.get(rtn, "Unknown RTN code")
 
-    def _decode_frame(self, data: bytes, direction: str = "TX") -> None:
+    def _decode_frame(self, hex_str: str, direction: str = "TX") -> None:
         """Decode and log frame structure.
         
+        hex_str is the decoded frame without SOI and EOI.
+        
         For commands (TX):
             CID2 = command type (42h, 4Fh etc)
         For responses (RX):
             CID2 = RTN (return code)
         """
         try:
-            hex_str = data[1:-1].decode('ascii')
-            
             # Break down into fields
             frame = {
                 "SOI": "7E",
@@ -311,36 +541,26 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Error decoding frame: %s", err)
             
-    def _validate_response(self, response: bytes) -> bool:
+    def _validate_response(self, hex_str: str) -> bool:
         """Validate response frame and return code.
         
+        Args:
+            hex_str: The decoded frame without SOI and EOI.
+            
         Returns:
             bool: True if response is valid and RTN is normal (00)
         """
         try:
-            # Get basic frame parts
-            hex_str = response[1:-1].decode('ascii')
             rtn = hex_str[6:8]  # CID2 position contains RTN for responses
             
             # Check return code
-            rtn_codes = {
-                "00": "Normal",
-                "01": "VER error",
-                "02": "CHKSUM error",
-                "03": "LCHKSUM error", 
-                "04": "CID2 invalidation",
-                "05": "Command format error",
-                "06": "Invalid data",
-                "90": "ADR error",
-                "91": "Communication error"
-            }
-            
-            if rtn not in rtn_codes:
+            description = RTN_CODES.get(rtn)
+            if description is None:
                 _LOGGER.warning("Unknown return code: %s", rtn)
                 return False
                 
             if rtn != "00":
-                _LOGGER.error("Error response received: %s", rtn_codes[rtn])
+                _LOGGER.error("Error response received: %s", description)
                 return False
                 
             return True
@@ -355,12 +575,20 @@ class AntraDataCoordinator(DataUpdateCoordinator):
             async with asyncio.timeout(timeout):
                 while True:
                     response = await self._reader.readuntil(b"\r")
+
+                    # Decode once (without SOI and EOI) for all checks below
+                    try:
+                        hex_str = response[1:-1].decode('ascii')
+                    except UnicodeDecodeError:
+                        _LOGGER.warning("Dropping frame with non-ASCII data")
+                        continue
                     
-                    # Decode for logging
-                    self._decode_frame(response, "RX")
+                    # Decode for logging (only worth the slicing when debugging)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        self._decode_frame(hex_str, "RX")
                     
-                    # Basic frame validation
-                    if not response.startswith(b"~") or not response.endswith(b"\r"):
+                    # Basic frame validation (readuntil already guarantees the EOI)
+                    if response[:1] != b"~":
                         _LOGGER.warning("Invalid frame format")
                         continue
                         
@@ -375,7 +603,7 @@ class AntraDataCoordinator(DataUpdateCoordinator):
                         continue
                         
                     # Validate RTN code
-                    if not self._validate_response(response):
+                    if not self._validate_response(hex_str):
                         _LOGGER.warning("Invalid response received, retrying...")
                         continue
                     
@@ -388,7 +616,7 @@ class AntraDataCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error reading response: %s", err)
             return None
 
-    def _parse_header_block(self, decoded: str, pos: int = 12) -> tuple[dict, int]:
+    def _parse_header_block(self, raw: bytes, pos: int = 6) -> tuple[dict, int]:
         """Parse system header block starting at given position.
         
         Format:
@@ -409,67 +637,62 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         64-65   Battery Count       raw     04 = 4 batteries
         
         Args:
-            decoded: Full hex string response
-            pos: Starting position of header block (default 12 after protocol header)
+            raw: The response converted to bytes
+            pos: Byte offset of the header block in raw (default 6 after protocol header)
             
         Returns:
-            Tuple of (header_data dict, new position after header)
+            Tuple of (header_data dict, byte offset after header)
         """
         try:
-            header = {}
-            
-            _LOGGER.debug("Header frame: %s", decoded[pos:pos+66])
-            
-            # System voltage and current
-            header["voltage"] = int(decoded[pos:pos+4], 16) / 100
-            header["current"] = convert_signed(decoded, pos+4, 4, scale=1);
-            _LOGGER.debug("current: %s -> %d", decoded[pos+4:pos+8], header["current"])
-
-                
-            # Voltage readings
-            header["total_capacity"] = int(decoded[pos+8:pos+12], 16)
-            header["remaining_capacity"] = int(decoded[pos+12:pos+16], 16)
-            
-            # State of charge
-            header["soc"] = int(decoded[pos+16:pos+20], 16)
-            
-            # Temperature readings
-            header["max_ambient_temp"] = convert_signed(decoded, pos+20, 4, scale=10)
-            header["min_ambient_temp"] = convert_signed(decoded, pos+24, 4, scale=10)
-            
-            # Cell voltage extremes
-            header["max_cell_voltage"] = int(decoded[pos+28:pos+32], 16) 
-            header["min_cell_voltage"] = int(decoded[pos+32:pos+36], 16) 
-            
-            # Status and temperature fields (36-43)
-
-            header["pack_temperature"] = convert_signed(decoded, pos+40, 4, scale=10)  # Pack temperature (was temperature_max)
-            header["alarm_status"] = int(decoded[pos+44:pos+48], 16)  # Raw alarm status value (was temperature_min)
-            _LOGGER.debug("Pack Temperature: %s -> %.1f°C", decoded[pos+40:pos+44], header["pack_temperature"])
-            _LOGGER.debug("Alarm Status: %s -> %d", decoded[pos+44:pos+48], header["alarm_status"])
-
-            # Store reserved bytes
-            header["reserved"] = decoded[pos+44:pos+62]
-                    
-            # System status and configuration (62-65)
-            header["current_status"] = int(decoded[pos+62:pos+64], 16)  # Current status bits
-            _LOGGER.debug("Current Status: %s -> %d", decoded[pos+62:pos+64], header["current_status"])
-            header["battery_count"] = int(decoded[pos+64:pos+66], 16)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Header frame: %s", raw[pos:pos+_HEADER.size].hex().upper())
+
+            (
+                voltage, current, total_capacity, remaining_capacity, soc,
+                max_ambient_temp, min_ambient_temp, max_cell_voltage, min_cell_voltage,
+                pack_temperature, alarm_status, current_status, battery_count,
+            ) = _HEADER.unpack_from(raw, pos)
+
+            header = {
+                # System voltage and current
+                "voltage": voltage / 100,
+                "current": float(current),
+                # Voltage readings
+                "total_capacity": total_capacity,
+                "remaining_capacity": remaining_capacity,
+                # State of charge
+                "soc": soc,
+                # Temperature readings
+                "max_ambient_temp": max_ambient_temp / 10,
+                "min_ambient_temp": min_ambient_temp / 10,
+                # Cell voltage extremes
+                "max_cell_voltage": max_cell_voltage,
+                "min_cell_voltage": min_cell_voltage,
+                # Status and temperature fields (36-47)
+                "pack_temperature": pack_temperature / 10,  # Pack temperature (was temperature_max)
+                "alarm_status": alarm_status,  # Raw alarm status value (was temperature_min)
+                # Store reserved bytes
+                "reserved": raw[pos+22:pos+31].hex().upper(),
+                # System status and configuration (62-65)
+                "current_status": current_status,  # Current status bits
+                "battery_count": battery_count,
+            }
             
-            _LOGGER.debug(
-                "Parsed header: V=%.2fV I=%.2fA SOC=%d%% Batt=%d PackTemp=%.1f°C AlarmStatus=%d CurrentStatus=%d", 
-                header["voltage"], header["current"], header["soc"],
-                header["battery_count"], header["pack_temperature"],
-                header["alarm_status"], header["current_status"]
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Parsed header: V=%.2fV I=%.2fA SOC=%d%% Batt=%d PackTemp=%.1f°C AlarmStatus=%d CurrentStatus=%d", 
+                    header["voltage"], header["current"], header["soc"],
+                    header["battery_count"], header["pack_temperature"],
+                    header["alarm_status"], header["current_status"]
+                )
             
-            return header, pos + 66  # Return data and new position
+            return header, pos + _HEADER.size  # Return data and new position
             
         except Exception as err:
             _LOGGER.error("Error parsing header block: %s", err)
             raise
             
-    def _parse_battery_block(self, decoded: str, pos: int) -> tuple[dict, int]:
+    def _parse_battery_block(self, raw: bytes, pos: int) -> tuple[dict, int]:
         """
         Parse a single battery block starting at the given position.
         
@@ -508,253 +731,108 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         170–173    IO Status (2 bytes, raw, bitflags)
         174–177    Additional Status (2 bytes, raw)
  
-        Total length = 93 bytes (186 hex digits).
+        Total length with 16 cells and 4 pack temperature sensors = 106 bytes
+        (212 hex digits); the cell and sensor counts move the later fields.
         
         Args:
-            decoded: Full hex string response.
-            pos: Starting position (index into the hex string) of this battery block.
+            raw: The response converted to bytes.
+            pos: Byte offset of this battery block in raw.
             
         Returns:
-            Tuple of (battery_data dict, new position after block)
+            Tuple of (battery_data dict, byte offset after block)
         """
         try:
-            battery = {}
-            start_pos = pos
-            _LOGGER.debug("Starting battery block parse at pos: %d", pos)
-            _LOGGER.debug("Battery frame: %s", decoded[pos:pos+212])
-            
-            # Battery Header (2 bytes = 4 hex digits)
-            # Only take the first byte for the battery number.
-            battery["number"] = int(decoded[pos:pos+2], 16)
-            _LOGGER.debug("Battery header: %s -> %d", decoded[pos:pos+2], battery["number"])
-            pos += 4  # Skip both bytes (first is battery number, second is reserved)
-            #_LOGGER.debug("After battery header, pos offset: %d", pos - start_pos)
-            
-            # SOC (1 byte = 2 hex digits)
-            battery["soc"] = int(decoded[pos:pos+2], 16)
-            _LOGGER.debug("SOC: %s -> %d", decoded[pos:pos+2], battery["soc"])
-            pos += 2
-            #_LOGGER.debug("After SOC, pos offset: %d", pos - start_pos)
-            
-            # Pack Voltage (2 bytes, /100)
-            battery["voltage"] = int(decoded[pos:pos+4], 16) / 100
-            _LOGGER.debug("Pack Voltage: %s -> %.2f V", decoded[pos:pos+4], battery["voltage"])
-            pos += 4
-            #_LOGGER.debug("After Pack Voltage, pos offset: %d", pos - start_pos)
-            
-            # Cell Count (1 byte)
-            cell_count = int(decoded[pos:pos+2], 16)
-            battery["cell_count"] = cell_count
-            _LOGGER.debug("Cell Count: %s -> %d", decoded[pos:pos+2], cell_count)
-            pos += 2
-            #_LOGGER.debug("After Cell Count, pos offset: %d", pos - start_pos)
-            
-            # 16 Cell Voltages (each 2 bytes, /1000)
-            cells = []
-            for i in range(cell_count):
-                cell_hex = decoded[pos:pos+4]
-                cell_voltage = int(cell_hex, 16) / 1000
-                cells.append(cell_voltage)
-                _LOGGER.debug("Cell %d Voltage: %s -> %.3f V", i+1, cell_hex, cell_voltage)
-                pos += 4
-            battery["cells"] = cells
-            #_LOGGER.debug("After Cell Voltages, pos offset: %d", pos - start_pos)
-            
-            # Ambient Temperature (2 bytes, /10)
-            battery["ambient_temperature"] = convert_signed(decoded, pos, 4, scale=10)
-            _LOGGER.debug("Ambient Temperature: %s -> %.1f °C", decoded[pos:pos+4], battery["ambient_temperature"])
-            pos += 4
-            #_LOGGER.debug("After Ambient Temperature, pos offset: %d", pos - start_pos)
-            
-            # Pack Average Temperature (2 bytes, /10)
-            battery["pack_avg_temperature"] = convert_signed(decoded, pos, 4, scale=10)
-            _LOGGER.debug("Pack Average Temperature: %s -> %.1f °C", decoded[pos:pos+4], battery["pack_avg_temperature"])
-            pos += 4
-            #_LOGGER.debug("After Pack Average Temperature, pos offset: %d", pos - start_pos)
-            
-            # MOS Temperature (2 bytes, /10)
-            battery["mos_temperature"] = convert_signed(decoded, pos, 4, scale=10)
-            _LOGGER.debug("MOS Temperature: %s -> %.1f °C", decoded[pos:pos+4], battery["mos_temperature"])
-            pos += 4
-            #_LOGGER.debug("After MOS Temperature, pos offset: %d", pos - start_pos)
-            
-            # Pack Temp Sensor Count (1 byte)
-            temp_sensor_count = int(decoded[pos:pos+2], 16)
-            battery["pack_temp_sensor_count"] = temp_sensor_count
-            _LOGGER.debug("Pack Temp Sensor Count: %s -> %d", decoded[pos:pos+2], temp_sensor_count)
-            pos += 2
-            #_LOGGER.debug("After Pack Temp Sensor Count, pos offset: %d", pos - start_pos)
-            
-            # Pack Temp Sensors (each 2 bytes, /10)
-            pack_temps = []
-            for i in range(temp_sensor_count):
-                pack_temp = convert_signed(decoded, pos, 4, scale=10)
-                pack_temps.append(pack_temp)
-                _LOGGER.debug("Pack Temp Sensor %d: %s -> %.1f °C", i+1, decoded[pos:pos+4], pack_temp)
-                pos += 4
-            battery["pack_temperatures"] = pack_temps
-            #_LOGGER.debug("After Pack Temp Sensors, pos offset: %d", pos - start_pos)
-            
-            # Charging/Discharging Current (2 bytes, /100)
-            battery["current"] = convert_signed(decoded, pos, 4, scale=100)
-            _LOGGER.debug("Charging/Discharging Current: %s -> %.2f", decoded[pos:pos+4], battery["current"])
-            pos += 4
-            #_LOGGER.debug("After Current, pos offset: %d", pos - start_pos)
-            
-            # Pack Internal Resistance (2 bytes, raw)
-            battery["internal_resistance"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Internal Resistance: %s -> %d", decoded[pos:pos+4], battery["internal_resistance"])
-            pos += 4
-            #_LOGGER.debug("After Internal Resistance, pos offset: %d", pos - start_pos)
-            
-            # Pack Health Status (SOH) (2 bytes, raw)
-            battery["soh"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("SOH: %s -> %d", decoded[pos:pos+4], battery["soh"])
-            pos += 4
-            #_LOGGER.debug("After SOH, pos offset: %d", pos - start_pos)
-            
-            # User–Defined Number (1 byte)
-            battery["user_defined"] = int(decoded[pos:pos+2], 16)
-            _LOGGER.debug("User Defined Number: %s -> %d", decoded[pos:pos+2], battery["user_defined"])
-            pos += 2
-            _LOGGER.debug("After User Defined Number, pos offset: %d", pos - start_pos)
-                        
-            # Full Charge Capacity (2 bytes, /100)
-            battery["full_charge_capacity"] = int(decoded[pos:pos+4], 16) / 100
-            _LOGGER.debug("Full Charge Capacity: %s -> %.2f", decoded[pos:pos+4], battery["full_charge_capacity"])
-            pos += 4
-            #_LOGGER.debug("After Full Charge Capacity, pos offset: %d", pos - start_pos)
-            
-            # Remaining Capacity (2 bytes, /100)
-            battery["remaining_capacity"] = int(decoded[pos:pos+4], 16) / 100
-            _LOGGER.debug("Remaining Capacity: %s -> %.2f", decoded[pos:pos+4], battery["remaining_capacity"])
-            pos += 4
-            #_LOGGER.debug("After Remaining Capacity, pos offset: %d", pos - start_pos)
-            
-            # Number of Cycles (2 bytes, raw)
-            battery["cycle_count"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Cycle Count: %s -> %d", decoded[pos:pos+4], battery["cycle_count"])
-            pos += 4
-            _LOGGER.debug("After Cycle Count, pos offset: %d", pos - start_pos)
-                        
-            # New Descriptive Fields:
-            # Assume the following order:
-            # 1. Maximum Cell Voltage (2 bytes, raw mV) – corresponds to original p18
-            battery["max_cell_voltage"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Max Cell Voltage: %s -> %d", decoded[pos:pos+4], battery["max_cell_voltage"])
-            pos += 4
-
-            # 2. Minimum Cell Voltage (2 bytes, raw mV) – corresponds to original p20
-            battery["min_cell_voltage"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Min Cell Voltage: %s -> %d", decoded[pos:pos+4], battery["min_cell_voltage"])
-            pos += 4
-
-            # Unknown Fields (each 2 bytes, raw)
-            battery["max_cell_temp"] = convert_signed(decoded, pos, 4, scale=10)
-            _LOGGER.debug("Max Cell Temp: %s -> %d", decoded[pos:pos+4], battery["max_cell_temp"])
-            pos += 4
-
-            battery["min_cell_temp"] = convert_signed(decoded, pos, 4, scale=10)
-            _LOGGER.debug("Min Cell Temp: %s -> %d", decoded[pos:pos+4], battery["min_cell_temp"])
-            pos += 4
-
-            battery["unknown_3"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Unknown 3: %s -> %d", decoded[pos:pos+4], battery["unknown_3"])
-            pos += 4
-
-            battery["unknown_4"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Unknown 4: %s -> %d", decoded[pos:pos+4], battery["unknown_4"])
-            pos += 4
-
-            battery["avg_cell_temp"] = convert_signed(decoded, pos, 4, scale=10)
-            _LOGGER.debug("Average Cell Temp?: %s -> %d", decoded[pos:pos+4], battery["avg_cell_temp"])
-            pos += 4
-
-            # 3. Average Cell Voltage (2 bytes) – corresponds to original p32
-            battery["average_cell_voltage"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Average Cell Voltage: %s -> %d", decoded[pos:pos+4], battery["average_cell_voltage"])
-            pos += 4
-
-            # 4. Historical Maximum Pack Voltage (2 bytes) – corresponds to original p34
-            battery["total_charge"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Total charge Ah: %s -> %d", decoded[pos:pos+4], battery["total_charge"])
-            pos += 4
-
-            # 5. Historical Maximum Cell Voltage (2 bytes) – corresponds to original p36
-            battery["total_discharge"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Total Discharge Ah: %s -> %d", decoded[pos:pos+4], battery["total_discharge"])
-            pos += 4
-
-            # Voltage Status (2 bytes, raw)
-            battery["voltage_status"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Voltage Status: %s -> %d", decoded[pos:pos+4], battery["voltage_status"])
-            pos += 4
-            #_LOGGER.debug("After Voltage Status, pos offset: %d", pos - start_pos)
-            
-            # Current Status (2 bytes, raw)
-            battery["current_status"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Current Status: %s -> %d", decoded[pos:pos+4], battery["current_status"])
-            pos += 4
-            #_LOGGER.debug("After Current Status, pos offset: %d", pos - start_pos)
-            
-            # Temperature Status (2 bytes, raw)
-            battery["temperature_status"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Temperature Status: %s -> %d", decoded[pos:pos+4], battery["temperature_status"])
-            pos += 4
-            #_LOGGER.debug("After Temperature Status, pos offset: %d", pos - start_pos)
-            
-            # Alarm Status (2 bytes, raw)
-            battery["alarm_status"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Alarm Status: %s -> %d", decoded[pos:pos+4], battery["alarm_status"])
-            pos += 4
-            #_LOGGER.debug("After Alarm Status, pos offset: %d", pos - start_pos)
-            
-            # FET Status (2 bytes, raw)
-            battery["fet_status"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("FET Status: %s -> %d", decoded[pos:pos+4], battery["fet_status"])
-            pos += 4
-            #_LOGGER.debug("After FET Status, pos offset: %d", pos - start_pos)
-            
-            # Final fields immediately following FET Status:
-            # Overvoltage Protect (2 bytes, raw)
-            battery["overvoltage_protect"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Overvoltage Protect: %s -> %d", decoded[pos:pos+4], battery["overvoltage_protect"])
-            pos += 4
-            #_LOGGER.debug("After Overvoltage Protect, pos offset: %d", pos - start_pos)
-            
-            # Undervoltage Protect (2 bytes, raw)
-            battery["undervoltage_protect"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Undervoltage Protect: %s -> %d", decoded[pos:pos+4], battery["undervoltage_protect"])
-            pos += 4
-            #_LOGGER.debug("After Undervoltage Protect, pos offset: %d", pos - start_pos)
-            
-            # Overvoltage Alarm (2 bytes, raw)
-            battery["overvoltage_alarm"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Overvoltage Alarm: %s -> %d", decoded[pos:pos+4], battery["overvoltage_alarm"])
-            pos += 4
-            #_LOGGER.debug("After Overvoltage Alarm, pos offset: %d", pos - start_pos)
-            
-            # Undervoltage Alarm (2 bytes, raw)
-            battery["undervoltage_alarm"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Undervoltage Alarm: %s -> %d", decoded[pos:pos+4], battery["undervoltage_alarm"])
-            pos += 4
-            #_LOGGER.debug("After Undervoltage Alarm, pos offset: %d", pos - start_pos)
-
-            # Balance status (2 bytes, raw)
-            battery["balance_status"] = int(decoded[pos:pos+4], 16)
-            _LOGGER.debug("Balance status: %s -> %d", decoded[pos:pos+4], battery["balance_status"])
-            pos += 4
-            #_LOGGER.debug("Balance status, pos offset: %d", pos - start_pos)
-            
-            expected_length = 212  # total hex digits (93 bytes)
-            if pos - start_pos != expected_length:
-                _LOGGER.warning("Battery block parse length mismatch: expected %d hex digits, got %d", 
-                                expected_length, pos - start_pos)
-            
-            _LOGGER.debug("Final parsed pos offset: %d", pos - start_pos)
-            _LOGGER.debug("Parsed battery: %s", battery)
+            # Debug logging is off in normal use, so skip building its arguments
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug("Starting battery block parse at byte offset: %d", pos)
+                _LOGGER.debug("Battery frame: %s", raw[pos:pos+_STANDARD_BATTERY_BLOCK_SIZE].hex().upper())
+
+            # The cell and temperature sensor counts decide the block layout,
+            # so read them first and then unpack the whole block in one go.
+            # unpack_from raises if the block runs past the frame.
+            cell_count = _BATTERY_HEAD.unpack_from(raw, pos)[3]
+            temp_sensor_count = raw[pos + _BATTERY_HEAD.size + 2 * cell_count + 6]
+            block = battery_block_struct(cell_count, temp_sensor_count)
+            values = block.unpack_from(raw, pos)
+
+            # The layout follows the counts either way, but flag packs that
+            # don't report the standard 16 cells and 4 pack temperature sensors
+            if block.size != _STANDARD_BATTERY_BLOCK_SIZE:
+                _LOGGER.warning(
+                    "Battery block parse length mismatch: expected %d hex digits, got %d",
+                    2 * _STANDARD_BATTERY_BLOCK_SIZE, 2 * block.size
+                )
+
+            number, soc, voltage = values[:3]
+            cells_end = 4 + cell_count
+            cells = [value / 1000 for value in values[4:cells_end]]
+            ambient, pack_avg, mos = values[cells_end:cells_end + 3]
+            temps_end = cells_end + 4 + temp_sensor_count
+            pack_temps = [value / 10 for value in values[cells_end + 4:temps_end]]
+            (
+                current, internal_resistance, soh, user_defined,
+                full_charge_capacity, remaining_capacity, cycle_count,
+                max_cell_voltage, min_cell_voltage,
+                max_cell_temp, min_cell_temp, unknown_3, unknown_4, avg_cell_temp,
+                average_cell_voltage, total_charge, total_discharge,
+                voltage_status, current_status, temperature_status, alarm_status, fet_status,
+                overvoltage_protect, undervoltage_protect, overvoltage_alarm, undervoltage_alarm,
+                balance_status,
+            ) = values[temps_end:]
+
+            battery = {
+                # Only the first header byte is the battery number, the second is reserved
+                "number": number,
+                "soc": soc,
+                "voltage": voltage / 100,
+                "cell_count": cell_count,
+                "cells": cells,
+                "ambient_temperature": ambient / 10,
+                "pack_avg_temperature": pack_avg / 10,
+                "mos_temperature": mos / 10,
+                "pack_temp_sensor_count": temp_sensor_count,
+                "pack_temperatures": pack_temps,
+                "current": current / 100,
+                "internal_resistance": internal_resistance,
+                "soh": soh,
+                "user_defined": user_defined,
+                "full_charge_capacity": full_charge_capacity / 100,
+                "remaining_capacity": remaining_capacity / 100,
+                "cycle_count": cycle_count,
+                # New Descriptive Fields (raw mV)
+                "max_cell_voltage": max_cell_voltage,
+                "min_cell_voltage": min_cell_voltage,
+                # Unknown Fields
+                "max_cell_temp": max_cell_temp / 10,
+                "min_cell_temp": min_cell_temp / 10,
+                "unknown_3": unknown_3,
+                "unknown_4": unknown_4,
+                "avg_cell_temp": avg_cell_temp / 10,
+                "average_cell_voltage": average_cell_voltage,
+                "total_charge": total_charge,
+                "total_discharge": total_discharge,
+                # Status words and per-cell protection bitmasks
+                "voltage_status": voltage_status,
+                "current_status": current_status,
+                "temperature_status": temperature_status,
+                "alarm_status": alarm_status,
+                "fet_status": fet_status,
+                "overvoltage_protect": overvoltage_protect,
+                "undervoltage_protect": undervoltage_protect,
+                "overvoltage_alarm": overvoltage_alarm,
+                "undervoltage_alarm": undervoltage_alarm,
+                "balance_status": balance_status,
+            }
+
+            if debug:
+                _LOGGER.debug(
+                    "Parsed battery %d: V=%.2fV I=%.2fA SOC=%d%% Cells=%d TempSensors=%d",
+                    number, battery["voltage"], battery["current"], soc,
+                    cell_count, temp_sensor_count
+                )
             
-            return battery, pos
+            return battery, pos + block.size
 
         except Exception as err:
             _LOGGER.error("Error parsing battery block: %s", err)
@@ -763,18 +841,29 @@ class AntraDataCoordinator(DataUpdateCoordinator):
 
     async def _send_command(self, command: bytes, battery_number: int | None = None) -> bytes | None:
         """Send command and get response."""
-        cmd_packet = self._build_command(command, battery_number)
-        formatted_cmd = self._format_message(cmd_packet)
-        _LOGGER.debug("Sending command: %s", formatted_cmd)
+        # Frames only depend on the command and address, so build each once
+        key = (command, battery_number)
+        cmd_packet = self._command_cache.get(key)
+        if cmd_packet is None:
+            cmd_packet = self._command_cache[key] = self._build_command(command, battery_number)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending command: %s", self._format_message(cmd_packet))
         
         try:
+            # Keep commands _COMMAND_SPACING apart, so only wait for what is
+            # left of it since the previous command was sent
+            loop = asyncio.get_running_loop()
+            wait = self._last_command_time + _COMMAND_SPACING - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
             self._writer.write(cmd_packet)
             await self._writer.drain()
+            self._last_command_time = loop.time()
             
-            # Protocol requires 850ms minimum between commands
-            await asyncio.sleep(0.9)
-            
-            response = await self._read_response()
+            # Start reading right away, with the same overall window the
+            # response used to get (0.9s sleep plus the 2s read timeout)
+            response = await self._read_response(timeout=2.9)
             if response:
                 _LOGGER.debug("Got complete response")
                 return response
@@ -797,38 +886,63 @@ class AntraDataCoordinator(DataUpdateCoordinator):
                     _LOGGER.error("No response received from BMS")
                     return self.data
 
-                # Convert response to hex string, removing SOI (~) and EOI (\r)
-                decoded = response[1:-1].decode('ascii', errors='ignore')
-                _LOGGER.debug("Decoded response length: %d", len(decoded))
+                # Parsing is deterministic, so an identical frame (common while
+                # the pack is idle) would give exactly the data we already hold
+                if response == self._last_response:
+                    _LOGGER.debug("Response unchanged since last poll, keeping parsed data")
+                    return self.data
+                self._last_response = response
+
+                _LOGGER.debug("Response length: %d", len(response))
 
-                # Clear existing data 
-                self.data = {}
+                # Reuse the dicts from the previous poll. Values are overwritten
+                # below and batteries that no longer report are dropped at the end.
+                data = self.data
+                previous_mask = self.available_mask
+                self.available_mask = 0
 
                 try:
                     # Parse system header first
-                    header_data, pos = self._parse_header_block(decoded)
+                    # Convert the frame (without SOI, CHKSUM and EOI) from ASCII
+                    # hex to bytes once; the parsers only work on these bytes
+                    raw = bytes.fromhex(response[1:-5].decode('ascii'))
+                    header_data, pos = self._parse_header_block(raw)
                     # Store both raw and transformed data
-                    self.data["raw_system"] = header_data  # Keep raw data for debugging
-                    self.data["group"] = self._transform_group_data(header_data)  # For sensors
+                    data["raw_system"] = header_data  # Keep raw data for debugging
+                    if (group := data.get("group")) is not None:
+                        group.update(zip(_GROUP_KEYS, _GROUP_VALUES(header_data)))
+                    else:
+                        data["group"] = self._transform_group_data(header_data)  # For sensors
                     
                     battery_count = header_data["battery_count"]
                     _LOGGER.debug("Found %d batteries in system", battery_count)
 
-                    # Parse each battery block
-                    for i in range(battery_count):
-                        try:
-                            battery_data, pos = self._parse_battery_block(decoded, pos)
+                    # Parse each battery block. Blocks are variable length, so once
+                    # one fails the following ones can't be located either; keep
+                    # the batteries parsed so far and stop there.
+                    try:
+                        for i in range(battery_count):
+                            battery_data, pos = self._parse_battery_block(raw, pos)
                             # Transform data for sensors and store using 1-based numbering
-                            self.data[i + 1] = self._transform_battery_data(battery_data, i + 1)
-                        except Exception as err:
-                            _LOGGER.error("Failed to parse battery %d: %s", i + 1, err)
-                            continue
+                            data[i + 1] = self._transform_battery_data(battery_data, i + 1)
+                            self.available_mask |= 1 << (i + 1)
+                    except Exception as err:
+                        _LOGGER.error(
+                            "Failed to parse battery %d, skipping %d remaining: %s",
+                            i + 1, battery_count - i - 1, err
+                        )
 
                 except Exception as err:
                     _LOGGER.error("Failed to parse header block: %s", err)
-                    return self.data
+                    data.clear()
+                    return data
 
-                return self.data
+                if stale := previous_mask & ~self.available_mask:
+                    for battery_num in range(stale.bit_length()):
+                        if stale & (1 << battery_num):
+                            del data[battery_num]
+
+                return data
 
             except Exception as err:
                 _LOGGER.error("Error in update cycle: %s", err)
@@ -840,37 +954,7 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         Args:
             header_data: Raw parsed header data from first 68 bytes
         """
-        return {
-            # System measurements (0-7)
-            "voltage": header_data["voltage"],  # 0-3 System average voltage
-            "current": header_data["current"],  # 4-7 System total current
-        
-            # Voltage fields (8-15)
-            "total_capacity": header_data["total_capacity"],  # 8-11
-            "remaining_capacity": header_data["remaining_capacity"],  # 12-15
-        
-            # System state (16-19)
-            "soc": header_data["soc"],  # 16-19 System SOC
-        
-            # Temperature readings (20-27)
-            "max_ambient_temp": header_data["max_ambient_temp"],  # 20-23
-            "min_ambient_temp": header_data["min_ambient_temp"],  # 24-27
-        
-            # Cell voltage range (28-35)
-            "max_cell_voltage": header_data["max_cell_voltage"],  # 28-31
-            "min_cell_voltage": header_data["min_cell_voltage"],  # 32-35
-        
-            # Status and temperature (36-43)
-            "alarm_status": header_data["alarm_status"],  # 36-39 Alarm status bits
-            "pack_temperature": header_data["pack_temperature"],  # 40-43 Pack temperature
-        
-            # Reserved bytes stored as hex (44-61)
-            "reserved": header_data["reserved"],  # 44-61
-        
-            # System status and configuration (62-65)
-            "current_status": header_data["current_status"],  # 62-63 Current status bits
-            "battery_count": header_data["battery_count"],  # 64-65
-        }
+        return dict(zip(_GROUP_KEYS, _GROUP_VALUES(header_data)))
 
     def _transform_battery_data(self, battery_data: dict, battery_num: int) -> dict:
         """Transform parsed battery data into sensor-compatible format.
@@ -884,75 +968,35 @@ class AntraDataCoordinator(DataUpdateCoordinator):
         """
         
          # Adjust the battery number from the parsed data (0-based) to the sensor's numbering (1-based)
-        parsed_battery_num = battery_data.get("number", 0)
-        adjusted_battery_num = parsed_battery_num + 1
-        _LOGGER.debug("Adjusting battery number from parsed %d to sensor number %d", parsed_battery_num, adjusted_battery_num)
-        battery_data["number"] = adjusted_battery_num
-        
-        return {
-            # Basic Info (0-9)
-            "number": battery_data["number"],  # Battery header (0-3)
-            "soc": battery_data["soc"],  # SOC (4–5)
-            "voltage": battery_data["voltage"],  # Pack Voltage (6–9)
-            "cell_count": len(battery_data["cells"]),  # Number of cells
-
-            # Cell Data (10-73)
-            "cell_voltages": battery_data["cells"],  # List of cell voltages (each as a float)
-
-            # Temperature Data (74-91)
-            "temp_count": battery_data["pack_temp_sensor_count"],  # Number of temperature sensors
-            "temperatures": battery_data["pack_temperatures"],  # List of sensor temperatures
-            
-            # Individual Temperature Sensors 
-            "ambient_temperature": battery_data.get("ambient_temperature"),
-            "pack_avg_temperature": battery_data.get("pack_avg_temperature"),
-            "mos_temperature": battery_data.get("mos_temperature"),
-
-            # Current and Resistance (92-99)
-            "current": battery_data["current"],  # Charging/Discharging Current
-            "internal_resistance": battery_data["internal_resistance"],
-
-            # Battery Health (100-105)
-            "soh": battery_data["soh"],  # State of Health
-            "user_defined": battery_data["user_defined"],
-
-            # Capacity Info (106-117)
-            "full_capacity": battery_data["full_charge_capacity"],
-            "remaining_capacity": battery_data["remaining_capacity"],
-            "cycle_count": battery_data["cycle_count"],
-            
-            # New Descriptive Fields (extracted by the parser)
-            "max_cell_voltage": battery_data["max_cell_voltage"],
-            "min_cell_voltage": battery_data["min_cell_voltage"],
-            "average_cell_voltage": battery_data["average_cell_voltage"],
-            "total_charge": battery_data["total_charge"],
-            "total_discharge": battery_data["total_discharge"],
-            
-            # Unknown Fields
-            "max_cell_temp": battery_data["max_cell_temp"],
-            "min_cell_temp": battery_data["min_cell_temp"],
-            "unknown_3": battery_data["unknown_3"],
-            "unknown_4": battery_data["unknown_4"],
-            "avg_cell_temp": battery_data["avg_cell_temp"],
-
-            # Status Values (118-143) combined into a single dict:
-            "status": {
-                "voltage": battery_data["voltage_status"],
-                "current": battery_data["current_status"],
-                "temperature": battery_data["temperature_status"],
-                "alarm": battery_data["alarm_status"],
-                "fet": battery_data["fet_status"],
-            },
-
-            # Protection States (final fields 144–159)
-            "protection": {
-                "overvoltage_protect": battery_data["overvoltage_protect"],
-                "undervoltage_protect": battery_data["undervoltage_protect"],
-                "overvoltage_alarm": battery_data["overvoltage_alarm"],
-                "undervoltage_alarm": battery_data["undervoltage_alarm"],
-                "balance_status": battery_data["balance_status"],
-            }
+        battery_data["number"] = battery_data.get("number", 0) + 1
+
+        battery = dict(zip(_BATTERY_KEYS, _BATTERY_VALUES(battery_data)))
+        # The status and protection dicts always have the same keys, so reuse
+        # the ones from this battery's previous poll and only update values
+        if (previous := self.data.get(battery_num)) is not None:
+            status = previous["status"]
+            status.update(zip(_STATUS_KEYS, _STATUS_VALUES(battery_data)))
+            protection = previous["protection"]
+            protection.update(zip(_PROTECTION_KEYS, _PROTECTION_VALUES(battery_data)))
+        else:
+            status = dict(zip(_STATUS_KEYS, _STATUS_VALUES(battery_data)))
+            protection = dict(zip(_PROTECTION_KEYS, _PROTECTION_VALUES(battery_data)))
+
+        # Decode the status words and protection bitmasks once per update so
+        # the entities only have to read the labels
+        status_decoded = {
+            definition.key: definition.decode(status[definition.key])
+            for definition in STATUS_MAPPINGS
         }
+        status_decoded["fet"] = decode_fet_status(status["fet"])
+
+        # Status Values (118-143) combined into a single dict
+        battery["status"] = status
+        battery["status_decoded"] = status_decoded
+        # Protection States (final fields 144–159)
+        battery["protection"] = protection
+        battery["protection_decoded"] = {key: decode_bitmask(bitmask) for key, bitmask in protection.items()}
+        return battery
 
     async def async_get_protocol_version(self) -> str:
         """Get protocol version from BMS."""
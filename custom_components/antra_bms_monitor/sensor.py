@@ -1,13 +1,16 @@
 """Antra BMS sensors.""" 
 from __future__ import annotations
-from homeassistant.const import UnitOfTemperature
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 
 import logging
+import sys
+import time
 from datetime import timedelta
-from typing import Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import NamedTuple
 
-from homeassistant.core import HomeAssistant
+import serial_asyncio
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -16,22 +19,30 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     CONF_PORT,
+    PERCENTAGE,
+    EntityCategory,
     UnitOfElectricPotential,
     UnitOfElectricCurrent,
-    PERCENTAGE,
     UnitOfTemperature,
 )
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_BAUD_RATE, CONF_MAX_BATTERIES
+from .const import DOMAIN, CONF_BAUD_RATE, CONF_MAX_BATTERIES, PUBLISH_MAX_INTERVAL
 from .coordinator import AntraDataCoordinator
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
-from homeassistant.const import EntityCategory
-
 _LOGGER = logging.getLogger(__name__)
 
+# Shared stand-in for missing data dicts; never mutated
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=4096)
+def _hex16(bitmask: int) -> str:
+    """Return hex(bitmask) for a 16-bit status word, cached and interned."""
+    return sys.intern(hex(bitmask))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -39,8 +50,6 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Antra sensor platform."""
-    import serial_asyncio
-
     _LOGGER.debug(
         "Setting up Antra sensor platform with config: port=%s, baud=%s, max_batteries=%s",
         entry.data[CONF_PORT],
@@ -69,241 +78,224 @@ async def async_setup_entry(
         update_interval=timedelta(seconds=30),
     )
 
-    # Do first update
-    _LOGGER.debug("Performing first coordinator refresh")
-    await coordinator.async_config_entry_first_refresh()
+    # Batteries that already have entities. Battery sensors are added by the
+    # listener once a battery reports data, since the number of cell and
+    # temperature sensors comes from that data.
+    added_batteries: set[int] = set()
+
+    def _new_battery_entities() -> list:
+        """Return the entities for batteries reporting data for the first time."""
+        new_batteries = [
+            battery_num
+            for battery_num in range(1, max_batteries + 1)
+            if battery_num not in added_batteries and coordinator.available_mask & (1 << battery_num)
+        ]
+        added_batteries.update(new_batteries)
+        return _build_battery_entities(coordinator, new_batteries)
+
+    @callback
+    def _async_add_new_batteries() -> None:
+        """Add entities for batteries reporting data for the first time."""
+        if entities := _new_battery_entities():
+            _LOGGER.info("Adding %d entities for newly reported Antra batteries", len(entities))
+            async_add_entities(entities)
+
+    # Pack header sensors don't depend on the battery layout, so add them
+    # straight away; they stay unknown until the first poll completes
+    entities = [
+        AntraPackHeaderSensor(coordinator, definition.data_key, definition.name, definition.unit)
+        for definition in pack_header_definitions
+    ]
+
+    _LOGGER.info("Adding %d Antra pack header entities", len(entities))
+    async_add_entities(entities, update_before_add=False)
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_batteries))
+
+    # Run the first poll in the background so platform setup isn't held up
+    # by the serial round-trip. ConfigEntry.async_create_background_task is
+    # newer than the minimum Home Assistant version in hacs.json, so create
+    # the task on hass and cancel it when the entry unloads.
+    _LOGGER.debug("Scheduling first coordinator refresh")
+    first_refresh = hass.async_create_background_task(
+        coordinator.async_refresh(), "antra_bms_monitor first refresh"
+    )
+    entry.async_on_unload(first_refresh.cancel)
+    _LOGGER.debug("Completed Antra sensor platform setup")
+
 
+def _build_battery_entities(coordinator: AntraDataCoordinator, battery_nums) -> list:
+    """Return every Antra entity for the given batteries, which must have coordinator data."""
     entities = []
-    
-    # Create entities for each battery - user sees batteries 1..max_batteries.
-    # We assume coordinator.data is a dict keyed by battery number (1, 2, 3, …)
-    for battery_num in range(1, max_batteries + 1):
+    for battery_num in battery_nums:
         _LOGGER.debug("Setting up sensors for battery %d", battery_num)
+        battery_data = coordinator.data[battery_num]
 
-        # Pack voltage sensor (key "voltage")
-        entities.append(
-            AntraVoltageSensor(
-                coordinator,
-                battery_num,
-                "voltage",
-                "Pack Voltage",
-                UnitOfElectricPotential.VOLT,
-            )
+        # Sensors keyed by a battery data field, then the fixed per-battery sensors
+        entities.extend(
+            sensor_cls(coordinator, battery_num, *args) for sensor_cls, *args in _PER_BATTERY_KEYED_SENSORS
         )
-        #_LOGGER.debug("Added pack voltage sensor for battery %d", battery_num)
-
-        # Current sensor
-        entities.append(AntraCurrentSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added current sensor for battery %d", battery_num)
+        entities.extend(sensor_cls(coordinator, battery_num) for sensor_cls in _PER_BATTERY_FIXED_SENSORS)
 
         # Cell voltage sensors – use key "cells"
-        battery_data = coordinator.data.get(battery_num)
-        if battery_data:
-            cell_voltages = battery_data.get("cell_voltages", [])
-            num_cells = len(cell_voltages)
-            #_LOGGER.debug("Battery %d has %d cells", battery_num, num_cells)
-            for cell_num in range(num_cells):
-                entities.append(AntraCellVoltageSensor(coordinator, battery_num, cell_num))
-            #_LOGGER.debug("Added %d cell voltage sensors for battery %d", num_cells, battery_num)
-        else:
-            _LOGGER.warning("No data available for battery %d during setup", battery_num)
-            
-        # Additional voltage sensors for descriptive fields (reuse the same voltage sensor class)
-        # These keys must be provided by your updated _transform_battery_data method.
-        entities.append(
-            AntraVoltageSensor(
-                coordinator,
-                battery_num,
-                "max_cell_voltage",
-                "Max Cell Voltage",
-                "mV",
-            )
-        )
-        entities.append(
-            AntraVoltageSensor(
-                coordinator,
-                battery_num,
-                "min_cell_voltage",
-                "Min Cell Voltage",
-                "mV",
-            )
-        )
-        entities.append(
-            AntraVoltageSensor(
-                coordinator,
-                battery_num,
-                "average_cell_voltage",
-                "Average Cell Voltage",
-                "mV",
-            )
-        )
-        entities.append(
-            AntraCapacitySensor(
-                coordinator,
-                battery_num,
-                "total_charge",
-                "Total Charge"
-            )
+        entities.extend(
+            AntraCellVoltageSensor(coordinator, battery_num, cell_num)
+            for cell_num in range(len(battery_data.get("cell_voltages", ())))
         )
-        entities.append(
-            AntraCapacitySensor(
-                coordinator,
-                battery_num,
-                "total_discharge",
-                "Total Discharge"
-            )
+
+        # Pack temperature sensors (from the array in "temperatures")
+        entities.extend(
+            AntraTemperatureSensor(coordinator, battery_num, temp_num, f"Pack Temperature Sensor {temp_num + 1}")
+            for temp_num in range(len(battery_data.get("temperatures", ())))
         )
-        #_LOGGER.debug("Added additional voltage sensors for battery %d", battery_num)
-        
-        # Final batch: Unknown fields (p22, p24, p26, p28, p30) as numeric sensors.
-        # We are not sure of their meaning, so we leave them as numeric.
-        unknown_fields = [
-            ("max_cell_temp", "Max Cell Temp"),
-            ("min_cell_temp", "Min Cell Temp"),
-            ("unknown_3", "Unknown 3"),
-            ("unknown_4", "Unknown 4"),
-            ("avg_cell_temp", "Average Cell Temp"),
-        ]
-        for data_key, friendly_name in unknown_fields:
-            add_numeric_sensor(entities, coordinator, battery_num, data_key, friendly_name)
-            #_LOGGER.debug("Added %s sensor for battery %d", friendly_name, battery_num)
-            
-        # --- Temperature Sensors ---
+    return entities
 
-        # Individual temperature sensors:
-        entities.append(AntraAmbientTemperatureSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added Ambient Temperature sensor for battery %d", battery_num)
 
-        entities.append(AntraPackAvgTemperatureSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added Pack Average Temperature sensor for battery %d", battery_num)
+@lru_cache(maxsize=None)
+def _battery_device_info(battery_num: int) -> DeviceInfo:
+    """Return the DeviceInfo shared by every sensor of a battery."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"battery_{battery_num}")},
+        name=f"Antra Battery {battery_num}",
+        manufacturer="Antra",
+        model="BLF-48105H",
+    )
+
+
+# DeviceInfo shared by every pack header sensor
+_GROUP_DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, "Antra_group")},
+    name="Antra Battery Group",
+    manufacturer="Antra",
+    model="BLF-48105H Group",
+)
 
-        entities.append(AntraMOSTemperatureSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added MOS Temperature sensor for battery %d", battery_num)
 
-        # Pack temperature sensors (from the array in "temperatures")
-        if battery_data:
-            pack_temps = battery_data.get("temperatures", [])
-            temp_count = len(pack_temps)
-            #_LOGGER.debug("Battery %d has %d pack temperature sensor(s)", battery_num, temp_count)
-            for temp_num in range(temp_count):
-                sensor_name = f"Pack Temperature Sensor {temp_num + 1}"
-                entities.append(
-                    AntraTemperatureSensor(coordinator, battery_num, temp_num, sensor_name)
-                )
-                #_LOGGER.debug("Added %s for battery %d", sensor_name, battery_num)
-        else:
-            _LOGGER.warning("No battery data available for pack temperature sensors on battery %d", battery_num)
-
-            
-        # SOC sensor
-        entities.append(AntraSocSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added SOC sensor for battery %d", battery_num)
-
-        # Internal Resistance sensor
-        entities.append(AntraInternalResistanceSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added Internal Resistance sensor for battery %d", battery_num)
-
-        # SOH sensor
-        entities.append(AntraSOHSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added SOH sensor for battery %d", battery_num)
-
-        # Full Capacity sensor
-        entities.append(AntraFullCapacitySensor(coordinator, battery_num))
-        #_LOGGER.debug("Added Full Capacity sensor for battery %d", battery_num)
-
-        # Remaining Capacity sensor
-        entities.append(AntraRemainingCapacitySensor(coordinator, battery_num))
-        #_LOGGER.debug("Added Remaining Capacity sensor for battery %d", battery_num)
-
-        # Cycle Count sensor
-        entities.append(AntraCycleCountSensor(coordinator, battery_num))
-        #_LOGGER.debug("Added Cycle Count sensor for battery %d", battery_num)
-
-        # Status sensors (voltage, current, temperature, alarm, FET)
-        # Status sensors (voltage, current, temperature, alarm, FET)
-        status_definitions = [
-            ("voltage", "Voltage Status", voltage_status_mapping),
-            ("current", "Current Status", current_status_mapping),
-            ("temperature", "Temperature Status", temperature_status_mapping),
-            ("alarm", "Alarm Status", alarm_status_mapping),
-        ]
-        for key, name, mapping in status_definitions:
-            # Add both raw and decoded sensors
-            entities.append(AntraStatusRawSensor(coordinator, battery_num, key, name))
-            entities.append(AntraStatusDecodedSensor(coordinator, battery_num, key, name, mapping))
-
-        # Special handling for FET status which has its own format
-        entities.append(AntraFETStatusRawSensor(coordinator, battery_num))
-        entities.append(AntraFETStatusDecodedSensor(coordinator, battery_num))
-
-        # Protection sensors (overvoltage_protect, undervoltage_protect, overvoltage_alarm, undervoltage_alarm)
-        protection_definitions = [
-            ("overvoltage_protect", "Overvoltage Protection"),
-            ("undervoltage_protect", "Undervoltage Protection"),
-            ("overvoltage_alarm", "Overvoltage Alarm"),
-            ("undervoltage_alarm", "Undervoltage Alarm"),
-            ("balance_status", "Balance Status"),
-        ]
-        for key, name in protection_definitions:
-        # Add both raw and decoded sensors
-            entities.append(AntraProtectStatusRawSensor(coordinator, battery_num, key, name))
-            entities.append(AntraProtectStatusDecodedSensor(coordinator, battery_num, key, name))
-            
-    # Add pack header sensors (one sensor per header field)
-    for data_key, friendly_name, unit in pack_header_definitions:
-        entities.append(AntraPackHeaderSensor(coordinator, data_key, friendly_name, unit))
-        _LOGGER.debug("Added pack header sensor: %s", friendly_name)
-
-    _LOGGER.info("Adding %d total Antra entities", len(entities))
-    async_add_entities(entities)
-    _LOGGER.debug("Completed Antra sensor platform setup")
-    
 class AntraBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Antra sensors."""
 
+    # The HA base classes keep a __dict__ for their own _attr_* values, so
+    # the slots only cover the attributes added by the Antra sensors.
+    __slots__ = (
+        "_display_num",
+        "_battery_num",
+        "_battery_bit",
+        "_uid_prefix",
+        "_battery_dict",
+        "_last_published",
+        "_last_published_available",
+        "_last_publish_time",
+    )
+
+    # Smallest change in native_value worth publishing before
+    # PUBLISH_MAX_INTERVAL has passed; None publishes every update
+    _publish_threshold: float | None = None
+
+    # Entity attributes that do not depend on the battery are set on the
+    # classes rather than on every instance
+    _attr_has_entity_name = True
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         # We assume the coordinator's data is keyed by battery number (1-based)
         self._display_num = battery_num  # User-facing number (1-based)
         self._battery_num = battery_num   # Use the same key for data lookup
-        self._attr_has_entity_name = True
+        self._battery_bit = 1 << battery_num  # Bit in the coordinator's available_mask
+        self._uid_prefix = f"Antra_{battery_num}"  # Shared start of every unique_id
+        self._attr_device_info = _battery_device_info(battery_num)
+        # Snapshot of this battery's data and its availability, refreshed once per coordinator update
+        self._refresh_battery_dict()
+        # Last state written by _handle_coordinator_update, used for throttling
+        self._last_published = None
+        self._last_published_available = None
+        self._last_publish_time = 0.0
         #_LOGGER.debug(
         #    "Initializing sensor for battery %d (coordinator data available: %s)",
         #    self._display_num,
         #    bool(coordinator.data and (self._battery_num in coordinator.data)),
         #)
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, f"battery_{self._display_num}")},
-            "name": f"Antra Battery {self._display_num}",
-            "manufacturer": "Antra",
-            "model": "BLF-48105H",
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        coordinator_data = self.coordinator.data
-        is_available = (
-            self.coordinator.last_update_success
-            and coordinator_data
-            and (self._battery_num in coordinator_data)
-        )
-        if not is_available:
+    def _refresh_battery_dict(self) -> None:
+        """Cache this battery's data and whether the entity is available."""
+        coordinator = self.coordinator
+        battery_present = bool(coordinator.available_mask & self._battery_bit)
+        self._battery_dict = coordinator.data[self._battery_num] if battery_present else None
+        self._attr_available = coordinator.last_update_success and battery_present
+        if not self._attr_available and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Sensor for battery %d unavailable (coordinator success: %s, battery in data: %s)",
                 self._display_num,
-                self.coordinator.last_update_success,
-                bool(coordinator_data and (self._battery_num in coordinator_data)),
+                coordinator.last_update_success,
+                battery_present,
             )
-        return is_available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached battery data and write the new state."""
+        self._refresh_battery_dict()
+        self._update_from_battery()
+        if self._should_publish():
+            self.async_write_ha_state()
+
+    def _should_publish(self) -> bool:
+        """Return whether the new state differs enough from the last one to write it."""
+        value = self.native_value
+        now = time.monotonic()
+        threshold = self._publish_threshold
+        last = self._last_published
+        if (
+            threshold is not None
+            and self._attr_available == self._last_published_available
+            and value is not None
+            and last is not None
+            # Scaled values like 3.01 - 3.0 come out a hair under the
+            # threshold, so round the step before comparing
+            and round(abs(value - last), 6) < threshold
+            and now - self._last_publish_time < PUBLISH_MAX_INTERVAL
+        ):
+            return False
+        self._last_published = value
+        self._last_published_available = self._attr_available
+        self._last_publish_time = now
+        return True
+
+    def _update_from_battery(self) -> None:
+        """Recompute values derived from the cached battery data (override in subclasses)."""
+
+    def _battery_value(self, key: str):
+        """Return one top-level value of the battery data, or None without data."""
+        if battery := self._battery_dict:
+            return battery.get(key)
+        return None
+
+    def _status_dict(self) -> dict:
+        """Return the battery's status words, or an empty dict without data."""
+        if (battery := self._battery_dict) and (status := battery.get("status")):
+            return status
+        return _EMPTY
+
+    def _protection_dict(self) -> dict:
+        """Return the battery's protection bitmasks, or an empty dict without data."""
+        if (battery := self._battery_dict) and (protection := battery.get("protection")):
+            return protection
+        return _EMPTY
+
+    @property
+    def available(self) -> bool:
+        """Return the availability cached at the last coordinator update."""
+        # CoordinatorEntity defines its own available property, so the cached
+        # _attr_available has to be returned explicitly.
+        return self._attr_available
 
 class AntraPackHeaderSensor(CoordinatorEntity, SensorEntity):
     """Sensor for one field from the Antra pack header (group) data."""
+
+    __slots__ = ("_data_key",)
+
+    # You might want to hide some sensors by default
+    _attr_entity_registry_enabled_default = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_has_entity_name = True
     
     def __init__(self, coordinator, data_key: str, name: str, unit: str | None = None) -> None:
         """Initialize the sensor."""
@@ -311,1078 +303,504 @@ class AntraPackHeaderSensor(CoordinatorEntity, SensorEntity):
         self._data_key = data_key
         self._attr_name = name
         self._attr_native_unit_of_measurement = unit
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_has_entity_name = True
         
         # For SOC sensor, set it as the device class battery to show in device status
         if data_key == "soc":
             self._attr_device_class = SensorDeviceClass.BATTERY
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for the sensor."""
-        return f"Antra_group_{self._data_key}"
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, "Antra_group")},
-            "name": "Antra Battery Group",
-            "manufacturer": "Antra",
-            "model": "BLF-48105H Group"
-        }
-        
-    @property
-    def entity_registry_enabled_default(self) -> bool:
-        """Indicate if entity should be enabled by default."""
-        # You might want to hide some sensors by default
-        return True
-
-    @property 
-    def native_value(self):
-        """Return the sensor value."""
+        self._attr_unique_id = f"Antra_group_{self._data_key}"
+        self._attr_device_info = _GROUP_DEVICE_INFO
+        self._update_from_group()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Read the new value, then write the state."""
+        self._update_from_group()
+        super()._handle_coordinator_update()
+
+    def _update_from_group(self) -> None:
+        """Read this field from the pack header data once per coordinator update."""
         group_data = self.coordinator.data.get("group")
         if group_data:
-            return group_data.get(self._data_key)
-        return None
-    
-pack_header_definitions = [
-    # (data_key, friendly name, unit)
-    ("voltage", "System Voltage", UnitOfElectricPotential.VOLT),
-    ("current", "System Current", UnitOfElectricCurrent.AMPERE),
-    ("total_capacity", "Total Capacity", "Ah"),  
-    ("remaining_capacity", "Remaining Capacity", "Ah"),
-    ("soc", "System SOC", PERCENTAGE),
-    ("max_ambient_temp", "Max Ambient Temperature", UnitOfTemperature.CELSIUS),
-    ("min_ambient_temp", "Min Ambient Temperature", UnitOfTemperature.CELSIUS),
-    ("max_cell_voltage", "Max Cell Voltage", "mV"),
-    ("min_cell_voltage", "Min Cell Voltage", "mV"),
-    ("alarm_status", "Alarm Status", None),  
-    ("pack_temperature", "Pack Temperature", UnitOfTemperature.CELSIUS),  
-    ("current_status", "Current Status", None), 
-    ("battery_count", "Battery Count", None),
-    ("reserved", "Reserved", None),    
-]
+            self._attr_native_value = group_data.get(self._data_key)
+        else:
+            self._attr_native_value = None
+    
+# Final batch of battery fields (p22, p24, p26, p28, p30) exposed as numeric sensors.
+# We are not sure of their meaning, so we leave them as numeric.
+unknown_fields = (
+    ("max_cell_temp", "Max Cell Temp"),
+    ("min_cell_temp", "Min Cell Temp"),
+    ("unknown_3", "Unknown 3"),
+    ("unknown_4", "Unknown 4"),
+    ("avg_cell_temp", "Average Cell Temp"),
+)
+
+
+class PackHeaderDef(NamedTuple):
+    """One pack header field exposed as an AntraPackHeaderSensor."""
+
+    data_key: str
+    name: str
+    unit: str | None
+
+
+pack_header_definitions = (
+    PackHeaderDef("voltage", "System Voltage", UnitOfElectricPotential.VOLT),
+    PackHeaderDef("current", "System Current", UnitOfElectricCurrent.AMPERE),
+    PackHeaderDef("total_capacity", "Total Capacity", "Ah"),  
+    PackHeaderDef("remaining_capacity", "Remaining Capacity", "Ah"),
+    PackHeaderDef("soc", "System SOC", PERCENTAGE),
+    PackHeaderDef("max_ambient_temp", "Max Ambient Temperature", UnitOfTemperature.CELSIUS),
+    PackHeaderDef("min_ambient_temp", "Min Ambient Temperature", UnitOfTemperature.CELSIUS),
+    PackHeaderDef("max_cell_voltage", "Max Cell Voltage", "mV"),
+    PackHeaderDef("min_cell_voltage", "Min Cell Voltage", "mV"),
+    PackHeaderDef("alarm_status", "Alarm Status", None),  
+    PackHeaderDef("pack_temperature", "Pack Temperature", UnitOfTemperature.CELSIUS),  
+    PackHeaderDef("current_status", "Current Status", None), 
+    PackHeaderDef("battery_count", "Battery Count", None),
+    PackHeaderDef("reserved", "Reserved", None),
+)
 
     
 class AntraCapacitySensor(AntraBaseSensor):
     """Sensor for battery capacity measurements."""
 
+    __slots__ = ("_data_key", "_getter")
+    _attr_native_unit_of_measurement = "Ah"
+    _attr_device_class = None  # Remove voltage device class
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str) -> None:
         super().__init__(coordinator, battery_num)
         self._data_key = data_key
+        self._getter = itemgetter(data_key)
         self._attr_name = name
-        self._attr_native_unit_of_measurement = "Ah"
-        self._attr_device_class = None  # Remove voltage device class
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_unique_id = f"{self._uid_prefix}_{self._data_key}"
+        self._update_from_battery()
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_{self._data_key}"
-
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get(self._data_key)
-        return None
+    def _update_from_battery(self) -> None:
+        try:
+            self._attr_native_value = self._getter(self._battery_dict)
+        except (TypeError, KeyError):
+            self._attr_native_value = None
     
 class AntraVoltageSensor(AntraBaseSensor):
     """Sensor for pack voltage."""
 
+    __slots__ = ("_data_key", "_getter")
+    _attr_device_class = SensorDeviceClass.VOLTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str, unit: str) -> None:
         """Initialize the voltage sensor."""
         super().__init__(coordinator, battery_num)
         self._data_key = data_key  # Expecting "voltage"
+        self._getter = itemgetter(data_key)
         self._attr_name = name
         self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = SensorDeviceClass.VOLTAGE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"Antra_{self._display_num}_{self._data_key}"
+        self._attr_unique_id = f"{self._uid_prefix}_{self._data_key}"
+        self._update_from_battery()
 
-    @property
-    def native_value(self):
-        """Return the pack voltage value."""
-        if self.available:
-            return self.coordinator.data[self._battery_num].get(self._data_key)
-        return None
+    def _update_from_battery(self) -> None:
+        """Read the voltage value once per coordinator update."""
+        try:
+            self._attr_native_value = self._getter(self._battery_dict)
+        except (TypeError, KeyError):
+            self._attr_native_value = None
 
 
 class AntraCurrentSensor(AntraBaseSensor):
     """Sensor for battery current."""
 
+    __slots__ = ()
+    _publish_threshold = 0.1  # A
+    _attr_name = "Current"
+    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+    _attr_device_class = SensorDeviceClass.CURRENT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         """Initialize the current sensor."""
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Current"
-        self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-        self._attr_device_class = SensorDeviceClass.CURRENT
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"Antra_{self._display_num}_current"
+        self._attr_unique_id = f"{self._uid_prefix}_current"
+        self._update_from_battery()
 
-    @property
-    def native_value(self):
-        """Return the current value with signed conversion if needed."""
-        if self.available:
-            raw_current = self.coordinator.data[self._battery_num].get("current")
-            if raw_current is not None:
-                # Assuming the raw value is already converted on the coordinator side,
-                # simply return it here.
-                return raw_current
-        return None
+    def _update_from_battery(self) -> None:
+        """Read the current (already signed on the coordinator side) once per update."""
+        self._attr_native_value = self._battery_value("current")
 
 
 class AntraCellVoltageSensor(AntraBaseSensor):
     """Sensor for individual cell voltages."""
 
+    __slots__ = ("_cell_num",)
+    _publish_threshold = 0.01  # V
+    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+    _attr_device_class = SensorDeviceClass.VOLTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, cell_num: int) -> None:
         """Initialize the cell voltage sensor."""
         super().__init__(coordinator, battery_num)
         self._cell_num = cell_num
         self._attr_name = f"Cell {cell_num + 1} Voltage"  # Display cells as 1-based
-        self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-        self._attr_device_class = SensorDeviceClass.VOLTAGE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"Antra_{self._display_num}_cell_{self._cell_num}_voltage"
-
-    @property
-    def native_value(self):
-        """Return the cell voltage value."""
-        if self.available:
-            cell_voltages = self.coordinator.data[self._battery_num].get("cell_voltages", [])
-            if 0 <= self._cell_num < len(cell_voltages):
-                return cell_voltages[self._cell_num]
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_cell_{self._cell_num}_voltage"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        """Pick this cell's voltage out of the battery data once per update."""
+        cell_voltages = self._battery_dict.get("cell_voltages") if self._battery_dict else None
+        if cell_voltages and self._cell_num < len(cell_voltages):
+            self._attr_native_value = cell_voltages[self._cell_num]
+        else:
+            self._attr_native_value = None
 
 
 class AntraTemperatureSensor(AntraBaseSensor):
     """Sensor for temperature values."""
 
+    __slots__ = ("_temp_num",)
+    _publish_threshold = 0.5  # °C
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, temp_num: int, name: str) -> None:
         """Initialize the temperature sensor."""
         super().__init__(coordinator, battery_num)
         self._temp_num = temp_num
         self._attr_name = name
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return f"Antra_{self._display_num}_temp_{self._temp_num}"
-
-    @property
-    def native_value(self):
-        """Return the temperature value (already converted on the coordinator side)."""
-        if self.available:
-            temps = self.coordinator.data[self._battery_num].get("temperatures", [])
-            if 0 <= self._temp_num < len(temps):
-                return temps[self._temp_num]
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_temp_{self._temp_num}"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        """Pick this sensor's temperature out of the battery data once per update."""
+        temps = self._battery_dict.get("temperatures") if self._battery_dict else None
+        if temps and self._temp_num < len(temps):
+            self._attr_native_value = temps[self._temp_num]
+        else:
+            self._attr_native_value = None
     
-from homeassistant.const import PERCENTAGE
-
 # --- Battery Level and Health Sensors ---
 
 class AntraSocSensor(AntraBaseSensor):
     """Sensor for battery State of Charge (SOC)."""
+
+    __slots__ = ()
+    _publish_threshold = 1  # %
+    _attr_name = "State of Charge"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_device_class = SensorDeviceClass.BATTERY
+    _attr_state_class = SensorStateClass.MEASUREMENT
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "State of Charge"
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.BATTERY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_soc"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("soc")
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_soc"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("soc")
 
 
 class AntraInternalResistanceSensor(AntraBaseSensor):
     """Sensor for battery internal resistance."""
+
+    __slots__ = ()
+    _attr_name = "Internal Resistance"
+    # Adjust the unit as appropriate (for example, "mΩ" if your value is in milliohms)
+    _attr_native_unit_of_measurement = "mΩ"
+    _attr_state_class = SensorStateClass.MEASUREMENT
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Internal Resistance"
-        # Adjust the unit as appropriate (for example, "mΩ" if your value is in milliohms)
-        self._attr_native_unit_of_measurement = "mΩ"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_internal_resistance"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("internal_resistance")
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_internal_resistance"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("internal_resistance")
 
 
 class AntraSOHSensor(AntraBaseSensor):
     """Sensor for battery State of Health (SOH)."""
+
+    __slots__ = ()
+    _attr_name = "State of Health"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_device_class = SensorDeviceClass.BATTERY
+    _attr_state_class = SensorStateClass.MEASUREMENT
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "State of Health"
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.BATTERY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_soh"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("soh")
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_soh"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("soh")
 
 
 class AntraFullCapacitySensor(AntraBaseSensor):
     """Sensor for full charge capacity."""
+
+    __slots__ = ()
+    _attr_name = "Full Charge Capacity"
+    # Adjust the unit if necessary (e.g. "Ah")
+    _attr_native_unit_of_measurement = "Ah"
+    _attr_state_class = SensorStateClass.MEASUREMENT
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Full Charge Capacity"
-        # Adjust the unit if necessary (e.g. "Ah")
-        self._attr_native_unit_of_measurement = "Ah"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_full_capacity"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("full_capacity")
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_full_capacity"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("full_capacity")
 
 
 class AntraRemainingCapacitySensor(AntraBaseSensor):
     """Sensor for remaining capacity."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
-        super().__init__(coordinator, battery_num)
-        self._attr_name = "Remaining Capacity"
-        self._attr_native_unit_of_measurement = "Ah"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_remaining_capacity"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("remaining_capacity")
-        return None
 
-
-class AntraCycleCountSensor(AntraBaseSensor):
-    """Sensor for battery cycle count."""
+    __slots__ = ()
+    _attr_name = "Remaining Capacity"
+    _attr_native_unit_of_measurement = "Ah"
+    _attr_state_class = SensorStateClass.MEASUREMENT
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Cycle Count"
-        # You might use "cycles" as unit if preferred.
-        self._attr_native_unit_of_measurement = None
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        
-    @property
-    
-    def unique_id(self):
-        return f"Antra_{self._display_num}_cycle_count"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("cycle_count")
-        return None
-
-# --- Generic Sensors for Nested Data ---
-
-class AntraStatusSensor(AntraBaseSensor):
-    """Generic sensor for a status value from the battery."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, status_key: str, name: str) -> None:
-        super().__init__(coordinator, battery_num)
-        self._status_key = status_key
-        self._attr_name = name
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_status_{self._status_key}"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            status = self.coordinator.data[self._battery_num].get("status", {})
-            return status.get(self._status_key)
-        return None
+        self._attr_unique_id = f"{self._uid_prefix}_remaining_capacity"
+        self._update_from_battery()
 
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("remaining_capacity")
 
-class AntraProtectionSensor(AntraBaseSensor):
-    """Generic sensor for a protection value from the battery."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, protection_key: str, name: str) -> None:
-        super().__init__(coordinator, battery_num)
-        self._protection_key = protection_key
-        self._attr_name = name
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_protection_{self._protection_key}"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            protection = self.coordinator.data[self._battery_num].get("protection", {})
-            return protection.get(self._protection_key)
-        return None
-
-
-class AntraBalanceSensor(AntraBaseSensor):
-    """Generic sensor for a cell balance value from the battery."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, balance_key: str, name: str) -> None:
-        super().__init__(coordinator, battery_num)
-        self._balance_key = balance_key
-        self._attr_name = name
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_balance_{self._balance_key}"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            balance = self.coordinator.data[self._battery_num].get("balance", {})
-            return balance.get(self._balance_key)
-        return None
 
-# --- Additional Status Sensors ---
+class AntraCycleCountSensor(AntraBaseSensor):
+    """Sensor for battery cycle count."""
 
-class AntraMachineStatusSensor(AntraBaseSensor):
-    """Sensor for machine status."""
+    __slots__ = ()
+    _attr_name = "Cycle Count"
+    # You might use "cycles" as unit if preferred.
+    _attr_native_unit_of_measurement = None
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Machine Status"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_machine_status"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("machine_status")
-        return None
-
+        self._attr_unique_id = f"{self._uid_prefix}_cycle_count"
+        self._update_from_battery()
 
-class AntraIOStatusSensor(AntraBaseSensor):
-    """Sensor for IO status."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
-        super().__init__(coordinator, battery_num)
-        self._attr_name = "IO Status"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_io_status"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("io_status")
-        return None
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("cycle_count")
 
-class AntraAdditionalStatusSensor(AntraBaseSensor):
-    """Sensor for additional status."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
-        super().__init__(coordinator, battery_num)
-        self._attr_name = "Additional Status"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_additional_status"
-    
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("additional_status")
-        return None
-    
 class AntraAmbientTemperatureSensor(AntraBaseSensor):
     """Sensor for ambient temperature."""
 
+    __slots__ = ()
+    _publish_threshold = 0.5  # °C
+    _attr_name = "Ambient Temperature"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Ambient Temperature"
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_unique_id = f"{self._uid_prefix}_ambient_temperature"
+        self._update_from_battery()
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_ambient_temperature"
-
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("ambient_temperature")
-        return None
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("ambient_temperature")
 
 
 class AntraPackAvgTemperatureSensor(AntraBaseSensor):
     """Sensor for pack average temperature."""
 
+    __slots__ = ()
+    _publish_threshold = 0.5  # °C
+    _attr_name = "Pack Average Temperature"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "Pack Average Temperature"
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_pack_avg_temperature"
+        self._attr_unique_id = f"{self._uid_prefix}_pack_avg_temperature"
+        self._update_from_battery()
 
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("pack_avg_temperature")
-        return None
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("pack_avg_temperature")
 
 class AntraMOSTemperatureSensor(AntraBaseSensor):
     """Sensor for MOS temperature."""
 
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
-        super().__init__(coordinator, battery_num)
-        self._attr_name = "MOS Temperature"
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_mos_temperature"
-
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get("mos_temperature")
-        return None
-
-def decode_bitmask(bitmask: int, total_cells: int = 16) -> str:
-    """Decode a bitmask integer into a comma-separated list of flagged cell numbers."""
-    flagged_cells = [str(i + 1) for i in range(total_cells) if bitmask & (1 << i)]
-    return ", ".join(flagged_cells)
-
-class AntraBitmaskSensor(AntraBaseSensor, SensorEntity):
-    """Generic sensor to decode a 16-bit bitmask for protection/alarm flags.
-    
-    The sensor’s main state is the raw bitmask (an integer),
-    and an extra attribute 'flagged_cells' contains a comma-separated list of cells (1–16)
-    whose bits are set.
-    """
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str) -> None:
-        """
-        Args:
-            coordinator: The data coordinator.
-            battery_num: Battery number.
-            data_key: The key in the protection dictionary (e.g. "overvoltage_protect").
-            name: A friendly name (e.g. "Overvoltage Protection").
-        """
-        super().__init__(coordinator, battery_num)
-        self._data_key = data_key
-        self._attr_name = name
-        #self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.entity_category = EntityCategory.DIAGNOSTIC
-        # Internal cache to store the last raw value
-        self._raw_value = None
-
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_{self._data_key}"
-
-    @property
-    def native_value(self):
-        """Return the raw bitmask value as the sensor state."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            # Directly retrieve the bitmask from the 'protection' dictionary
-            protection = data.get("protection", {})
-            bitmask = protection.get(self._data_key)
-            #_LOGGER.debug(
-            #    "AntraBitmaskSensor (battery %s, key %s): raw bitmask = %s",
-            #    self._display_num, self._data_key, bitmask
-            #)
-            if bitmask is None:
-                _LOGGER.debug(
-                    "AntraBitmaskSensor (battery %s, key %s): No bitmask value found in 'protection'.",
-                    self._display_num, self._data_key
-                )
-                return None
-            self._raw_value = bitmask
-            #_LOGGER.debug(
-            #    "AntraBitmaskSensor (battery %s, key %s): Using bitmask value: %s",
-            #    self._display_num, self._data_key, bitmask
-            #)
-            return hex(bitmask)
-        _LOGGER.debug(
-            "AntraBitmaskSensor (battery %s, key %s): Sensor not available.",
-            self._display_num, self._data_key
-        )
-        return None
-
-    @property
-    def extra_state_attributes(self):
-        """Return a formatted version of the bitmask as a list of flagged cell numbers."""
-        attributes = {}
-        if self._raw_value is not None:
-            flagged_cells = decode_bitmask(self._raw_value)
-            #_LOGGER.debug(
-            #    "AntraBitmaskSensor (battery %s, key %s): Decoded flagged_cells = %s",
-            #    self._display_num, self._data_key, flagged_cells
-            #)
-            attributes["flagged_cells"] = flagged_cells
-        else:
-            _LOGGER.debug(
-                "AntraBitmaskSensor (battery %s, key %s): No raw value cached for extra attributes.",
-                self._display_num, self._data_key
-            )
-        return attributes
-
-def decode_status_bitmask(bitmask: int, mapping: dict) -> str:
-    """
-    Decode a status bitmask using the provided mapping.
-    
-    Args:
-        bitmask: The raw bitmask as an integer.
-        mapping: A dictionary where the keys are bit positions (int) and the values
-                 are the corresponding status labels (str).
-                 
-    Returns:
-        A comma-separated string of status labels for each bit that is set.
-    """
-    statuses = [label for bit, label in mapping.items() if bitmask & (1 << bit)]
-    return ", ".join(statuses)
-
-class AntraStatusBitmaskSensor(AntraBaseSensor, SensorEntity):
-    """
-    Generic sensor to decode a 16-bit status bitmask.
-    
-    The sensor’s main state is the raw bitmask (an integer) from the "status" dictionary,
-    and an extra attribute 'decoded_status' contains a comma-separated list of status labels.
-    """
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str, mapping: dict) -> None:
-        """
-        Args:
-            coordinator: The data coordinator.
-            battery_num: Battery number.
-            data_key: The key in the status dictionary (e.g. "voltage" or "current").
-            name: A friendly name (e.g. "Voltage Status").
-            mapping: A dict mapping bit positions to their corresponding labels.
-        """
-        super().__init__(coordinator, battery_num)
-        self._data_key = data_key
-        self._attr_name = name
-        #self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.entity_category = EntityCategory.DIAGNOSTIC
-        self._mapping = mapping
-        self._raw_value = None  # Cache for the raw bitmask
-
-    @property
-    def unique_id(self):
-        # Append a prefix "status" so that it does not conflict with the pack voltage sensor
-        return f"Antra_{self._display_num}_map_{self._data_key}"
-
-    @property
-    def native_value(self):
-        """Return the raw bitmask value from the status dictionary."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            status_data = data.get("status", {})
-            raw_val = status_data.get(self._data_key)
-            #_LOGGER.debug(
-            #    "AntraStatusBitmaskSensor (battery %s, key %s): raw value from data = %s",
-            #    self._display_num, self._data_key, raw_val
-            #)
-            if raw_val is None:
-                _LOGGER.debug(
-                    "AntraStatusBitmaskSensor (battery %s, key %s): No raw value found.",
-                    self._display_num, self._data_key
-                )
-                return None
-            try:
-                # In case the raw value is a string with commas (e.g., "3,465")
-                bitmask = int(str(raw_val).replace(",", ""))
-            except ValueError:
-                _LOGGER.error(
-                    "AntraStatusBitmaskSensor (battery %s, key %s): Unable to convert raw value '%s' to integer.",
-                    self._display_num, self._data_key, raw_val
-                )
-                return None
-            self._raw_value = bitmask
-            #_LOGGER.debug(
-            #    "AntraStatusBitmaskSensor (battery %s, key %s): Using bitmask value: %s",
-            #    self._display_num, self._data_key, bitmask
-            #)
-            return hex(bitmask)
-        _LOGGER.debug(
-            "AntraStatusBitmaskSensor (battery %s, key %s): Sensor not available.",
-            self._display_num, self._data_key
-        )
-        return None
-
-    @property
-    def extra_state_attributes(self):
-        """Return a decoded version of the status as a list of active status labels."""
-        attributes = {}
-        if self._raw_value is not None:
-            decoded = decode_status_bitmask(self._raw_value, self._mapping)
-            #_LOGGER.debug(
-            #    "AntraStatusBitmaskSensor (battery %s, key %s): Decoded statuses = %s",
-            #    self._display_num, self._data_key, decoded
-            #)
-            attributes["decoded_status"] = decoded
-        return attributes
-
-# Voltage status mapping:
-voltage_status_mapping = {
-    0: "Cell Overvoltage Protection",     # B0
-    1: "Cell Undervoltage Protection",     # B1
-    2: "Pack Overvoltage Protection",        # B2
-    3: "Pack Undervoltage Protection",       # B3
-    4: "Cell Overvoltage Alarm",             # B4
-    5: "Cell Undervoltage Alarm",            # B5
-    6: "Pack Overvoltage Alarm",             # B6
-    7: "Pack Undervoltage Alarm",            # B7
-    8: "Cell Voltage Difference Alarm",      # B8
-    15: "System Sleep"                       # B15
-}
-
-# Current status mapping:
-current_status_mapping = {
-    0: "Charging",                           # B0
-    1: "Discharging",                        # B1
-    2: "Charge Overcurrent Protection",      # B2
-    3: "Short Circuit Protection",           # B3
-    4: "Discharge Overcurrent 1 Protection",   # B4
-    5: "Discharge Overcurrent 2 Protection",   # B5
-    6: "Charge Overcurrent Alarm",           # B6
-    7: "Discharge Overcurrent Alarm"         # B7
-}
-
-# Mapping for Temperature Status (each bit position corresponds to a specific temperature protection/alarm)
-temperature_status_mapping = {
-    0: "Charge Over Temperature Protection",    # B0
-    1: "Charge Under Temperature Protection",    # B1
-    2: "Discharge Over Temperature Protection",  # B2
-    3: "Discharge Under Temperature Protection", # B3
-    4: "Ambient Over Temperature Protection",    # B4
-    5: "Ambient Under Temperature Protection",   # B5
-    6: "MOS Over Temperature Protection",        # B6
-    7: "MOS Under Temperature Protection",       # B7
-    8: "Charge Over Temperature Alarm",          # B8
-    9: "Charge Under Temperature Alarm",         # B9
-    10: "Discharge Over Temperature Alarm",       # B10
-    11: "Discharge Under Temperature Alarm",      # B11
-    12: "Ambient Over Temperature Alarm",         # B12
-    13: "Ambient Under Temperature Alarm",        # B13
-    14: "MOS Over Temperature Alarm",             # B14
-    15: "MOS Under Temperature Alarm",            # B15
-}
-
-# Mapping for Alarm Status
-alarm_status_mapping = {
-    0: "Cell Voltage Differential Alarm",  # B0
-    1: "Charge MOS Damage Alarm",            # B1
-    2: "External SD Card Failure Alarm",     # B2
-    3: "SPI Communication Failure Alarm",    # B3
-    4: "EEPROM Failure Alarm",               # B4
-    5: "LED Alarm Enable",                   # B5
-    6: "Buzzer Alarm Enable",                # B6
-    7: "Low Battery Alarm",                  # B7
-    8: "MOS Over Temperature Protection",    # B8
-    9: "MOS Over Temperature Alarm",         # B9
-    10: "Current Limiting Board Failure",    # B10
-    11: "Sampling Failure",                  # B11
-    12: "Battery Failure",                   # B12
-    13: "NTC Failure",                       # B13
-    14: "Charge MOS Failure",                # B14
-    15: "Discharge MOS Failure",             # B15
-}
-
-def decode_fet_status(bitmask: int) -> str:
-    """
-    Decode FET Status bitmask into a comma-separated string.
-    
-    Bit assignments:
-      - Bit 0: Charge MOS status (1 = on, 0 = off)
-      - Bit 1: Disharge MOS status (1 = on, 0 = off)
-      - Bit 2: Discharge MOS failure (1 = damaged)
-      - Bit 3: Charge MOS failure (assumed; 1 = damaged)
-      - Bits 4-5: Current limiting mode:
-           00: No current limit
-           01: Current limit 5A
-           10: Current limit 10A
-           11: Current limit 25A
-      - Bits 6-10: Reserved (ignored)
-      - Bit 11: LED alarm enable (1 = enabled)
-      - Bit 12: Beep enable (1 = enabled)
-      - Bits 13-15: Reserved (ignored)
-    """
-    statuses = []
-    
-    # Bit 0: Discharge MOS status
-    if bitmask & (1 << 0):
-        statuses.append("Charge MOS: On")
-    else:
-        statuses.append("Charge MOS: Off")
-    
-    # Bit 1: Charge MOS status
-    if bitmask & (1 << 1):
-        statuses.append("Disharge MOS: On")
-    else:
-        statuses.append("Disharge MOS: Off")
-    
-    # Bit 2: Discharge MOS failure
-    if bitmask & (1 << 2):
-        statuses.append("Discharge MOS Failure")
-    
-    # Bit 3: Charge MOS failure (assumed)
-    if bitmask & (1 << 3):
-        statuses.append("Charge MOS Failure")
-    
-    # Bits 4-5: Current limiting mode (always decode)
-    current_limiting = (bitmask >> 4) & 0b11  # extract bits 4 and 5
-    current_limiting_mapping = {
-        0: "No current limit",
-        1: "Current limit 5A",
-        2: "Current limit 10A",
-        3: "Current limit 25A",
-    }
-    statuses.append(current_limiting_mapping[current_limiting])
-    
-    # Bits 6-10 are reserved; we ignore them.
-    
-    # Bit 11: LED alarm enable
-    if bitmask & (1 << 11):
-        statuses.append("LED alarm enabled")
-    
-    # Bit 12: Beep enable
-    if bitmask & (1 << 12):
-        statuses.append("Beep enabled")
-    
-    # Bits 13-15 are reserved; ignore.
-    return ", ".join(statuses)
+    __slots__ = ()
+    _publish_threshold = 0.5  # °C
+    _attr_name = "MOS Temperature"
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
-class AntraFETStatusSensor(AntraBaseSensor, SensorEntity):
-    """
-    Sensor to decode FET Status.
-    
-    - The native state is the raw integer (bitmask) value.
-    - An extra attribute 'decoded_status' provides a comma-separated
-      string with the decoded information.
-    
-    Expected raw data should be available under the status dictionary with a key
-    (e.g., "fet") that you must ensure is provided by your transformation function.
-    """
-    
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
-        """Initialize the FET Status sensor."""
         super().__init__(coordinator, battery_num)
-        self._attr_name = "FET Status"
-        #self._attr_state_class = SensorStateClass.MEASUREMENT
-        self.entity_category = EntityCategory.DIAGNOSTIC
-        self._raw_value = None
+        self._attr_unique_id = f"{self._uid_prefix}_mos_temperature"
+        self._update_from_battery()
 
-    @property
-    def unique_id(self):
-        # Use a unique ID that distinguishes this sensor from others.
-        return f"Antra_{self._display_num}_fet_status"
-
-    @property
-    def native_value(self):
-        """Return the raw bitmask value for FET Status."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            status_data = data.get("status", {})
-            # Use the key "fet" for FET Status.
-            raw_val = status_data.get("fet")
-            #_LOGGER.debug(
-            #    "AntraFETStatusSensor (battery %s): raw value from data = %s",
-            #    self._display_num, raw_val
-            #)
-            if raw_val is None:
-                _LOGGER.debug(
-                    "AntraFETStatusSensor (battery %s): No value found for FET Status.",
-                    self._display_num
-                )
-                return None
-            try:
-                # Remove any commas and convert to integer.
-                bitmask = int(str(raw_val).replace(",", ""))
-            except ValueError:
-                _LOGGER.error(
-                    "AntraFETStatusSensor (battery %s): Unable to convert raw value '%s' to integer.",
-                    self._display_num, raw_val
-                )
-                return None
-            self._raw_value = bitmask
-            #_LOGGER.debug(
-            #    "AntraFETStatusSensor (battery %s): Using bitmask value: %s",
-            #    self._display_num, bitmask
-            #)
-            return hex(bitmask)
-        _LOGGER.debug(
-            "AntraFETStatusSensor (battery %s): Sensor not available.",
-            self._display_num
-        )
-        return None
+    def _update_from_battery(self) -> None:
+        self._attr_native_value = self._battery_value("mos_temperature")
 
-    @property
-    def extra_state_attributes(self):
-        """Return the decoded FET Status as a comma-separated list."""
-        attributes = {}
-        if self._raw_value is not None:
-            decoded = decode_fet_status(self._raw_value)
-            #_LOGGER.debug(
-            #    "AntraFETStatusSensor (battery %s): Decoded FET Status = %s",
-            #    self._display_num, decoded
-            #)
-            attributes["decoded_status"] = decoded
-        else:
-            _LOGGER.debug(
-                "AntraFETStatusSensor (battery %s): No raw value cached for decoding.",
-                self._display_num
-            )
-        return attributes
-    
-def add_numeric_sensor(entities, coordinator, battery_num, data_key, friendly_name, unit=None):
-    """Helper to create and add a generic numeric sensor."""
-    sensor = AntraNumberSensor(coordinator, battery_num, data_key, friendly_name, unit)
-    entities.append(sensor)
-    
 class AntraNumberSensor(AntraBaseSensor, SensorEntity):
     """Generic sensor for numeric values from Antra data."""
+
+    __slots__ = ("_data_key", "_getter")
+    _attr_state_class = SensorStateClass.MEASUREMENT
     
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str, unit: str | None = None) -> None:
         super().__init__(coordinator, battery_num)
         self._data_key = data_key
+        self._getter = itemgetter(data_key)
         self._attr_name = name
         # Optionally set a unit if known; otherwise leave as None.
         self._attr_native_unit_of_measurement = unit
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_unique_id = f"{self._uid_prefix}_{self._data_key}"
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        try:
+            self._attr_native_value = self._getter(self._battery_dict)
+        except (TypeError, KeyError):
+            self._attr_native_value = None
+
+# Status words exposed by AntraStatusAggregateSensor, decoded by the coordinator
+status_definitions = ("voltage", "current", "temperature", "alarm", "fet")
+
+# Per-cell bitmasks exposed by AntraProtectionAggregateSensor
+protection_definitions = (
+    "overvoltage_protect",
+    "undervoltage_protect",
+    "overvoltage_alarm",
+    "undervoltage_alarm",
+    "balance_status",
+)
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_{self._data_key}"
+# Getters and attribute keys for the aggregate sensors, built once at import
+_STATUS_WORDS = itemgetter(*status_definitions)
+_STATUS_ATTR_KEYS = tuple((f"{key}_raw", f"{key}_decoded") for key in status_definitions)
+_PROTECTION_WORDS = itemgetter(*protection_definitions)
+_PROTECTION_ATTR_KEYS = tuple((f"{key}_raw", f"{key}_decoded") for key in protection_definitions)
 
-    @property
-    def native_value(self):
-        if self.available:
-            return self.coordinator.data[self._battery_num].get(self._data_key)
-        return None
 
-class AntraStatusRawSensor(AntraBaseSensor, SensorEntity):
-    """Raw hex value sensor for status bitmasks."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str) -> None:
-        super().__init__(coordinator, battery_num)
-        self._data_key = data_key
-        self._attr_name = f"{name} Raw"
-        self.entity_category = EntityCategory.DIAGNOSTIC
+class AntraStatusAggregateSensor(AntraBaseSensor):
+    """Diagnostic sensor combining all status words of a battery.
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_{self._data_key}_raw"
-
-    @property
-    def native_value(self):
-        """Return the raw hex value."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            status_data = data.get("status", {})
-            raw_val = status_data.get(self._data_key)
-            if raw_val is not None:
-                try:
-                    bitmask = int(str(raw_val).replace(",", ""))
-                    return hex(bitmask)
-                except ValueError:
-                    return None
-        return None
-
-class AntraStatusDecodedSensor(AntraBaseSensor, SensorEntity):
-    """Decoded value sensor for status bitmasks."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, data_key: str, name: str, mapping: dict) -> None:
-        super().__init__(coordinator, battery_num)
-        self._data_key = data_key
-        self._attr_name = f"{name} Decoded"
-        self.entity_category = EntityCategory.DIAGNOSTIC
-        self._mapping = mapping
+    The state is the combined status word (voltage, current, temperature,
+    alarm and FET status, 4 hex digits each). The attributes carry the raw
+    hex value and the decoded labels for every word, e.g. 'voltage_raw' and
+    'voltage_decoded'.
+    """
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_{self._data_key}_decoded"
+    __slots__ = ("_cached_bitmasks",)
+    _attr_name = "Status"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self):
-        """Return the decoded status string."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            status_data = data.get("status", {})
-            raw_val = status_data.get(self._data_key)
-            if raw_val is not None:
-                try:
-                    bitmask = int(str(raw_val).replace(",", ""))
-                    return decode_status_bitmask(bitmask, self._mapping) or "None"
-                except ValueError:
-                    return None
-        return None
-    
-class AntraFETStatusRawSensor(AntraBaseSensor, SensorEntity):
-    """Raw hex value sensor for FET status."""
-    
     def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._attr_name = "FET Status Raw"
-        self.entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_fet_status_raw"
-
-    @property
-    def native_value(self):
-        """Return the raw hex value."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            status_data = data.get("status", {})
-            raw_val = status_data.get("fet")
-            if raw_val is not None:
-                try:
-                    bitmask = int(str(raw_val).replace(",", ""))
-                    return hex(bitmask)
-                except ValueError:
-                    return None
-        return None
-
+        self._attr_unique_id = f"{self._uid_prefix}_status"
+        self._cached_bitmasks = None
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        """Decode the status words once per coordinator update."""
+        status = self._status_dict()
+        if not status:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = _EMPTY
+            self._cached_bitmasks = None
+            return
+
+        bitmasks = _STATUS_WORDS(status)
+        # Status words rarely change between polls, so keep the last state and attributes
+        if bitmasks == self._cached_bitmasks:
+            return
+        self._cached_bitmasks = bitmasks
+
+        decoded = self._battery_dict["status_decoded"]
+        attributes = {}
+        for key, bitmask, (raw_key, decoded_key) in zip(status_definitions, bitmasks, _STATUS_ATTR_KEYS):
+            attributes[raw_key] = _hex16(bitmask)
+            attributes[decoded_key] = decoded[key] or "None"
 
-class AntraFETStatusDecodedSensor(AntraBaseSensor, SensorEntity):
-    """Decoded value sensor for FET status."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
-        super().__init__(coordinator, battery_num)
-        self._attr_name = "FET Status Decoded"
-        self.entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_native_value = " ".join([f"{bitmask:04X}" for bitmask in bitmasks])
+        self._attr_extra_state_attributes = attributes
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_fet_status_decoded"
 
-    @property
-    def native_value(self):
-        """Return the decoded FET status string."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            status_data = data.get("status", {})
-            raw_val = status_data.get("fet")
-            if raw_val is not None:
-                try:
-                    bitmask = int(str(raw_val).replace(",", ""))
-                    return decode_fet_status(bitmask)
-                except ValueError:
-                    return None
-        return None
-    
-class AntraProtectStatusRawSensor(AntraBaseSensor, SensorEntity):
-    """Raw hex value sensor for protection status."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, protection_key: str, name: str) -> None:
-        super().__init__(coordinator, battery_num)
-        self._protection_key = protection_key 
-        self._attr_name = f"{name} Raw"
-        self.entity_category = EntityCategory.DIAGNOSTIC
+class AntraProtectionAggregateSensor(AntraBaseSensor):
+    """Diagnostic sensor combining all per-cell protection bitmasks of a battery.
 
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_protection_{self._protection_key}_raw"
+    The state is the combined protection word (one 4 hex digit word per
+    bitmask). The attributes carry the raw hex value and the flagged cell
+    numbers for every bitmask, e.g. 'overvoltage_alarm_raw' and
+    'overvoltage_alarm_decoded'.
+    """
 
-    @property
-    def native_value(self):
-        """Return the raw hex value."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            protection = data.get("protection", {})
-            raw_val = protection.get(self._protection_key)
-            if raw_val is not None:
-                try:
-                    bitmask = int(str(raw_val).replace(",", ""))
-                    return hex(bitmask)
-                except ValueError:
-                    return None
-        return None
+    __slots__ = ("_cached_bitmasks",)
+    _attr_name = "Protection Status"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-class AntraProtectStatusDecodedSensor(AntraBaseSensor, SensorEntity):
-    """Decoded value sensor for protection status."""
-    
-    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int, protection_key: str, name: str) -> None:
+    def __init__(self, coordinator: AntraDataCoordinator, battery_num: int) -> None:
         super().__init__(coordinator, battery_num)
-        self._protection_key = protection_key
-        self._attr_name = f"{name} Decoded"
-        self.entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def unique_id(self):
-        return f"Antra_{self._display_num}_protection_{self._protection_key}_decoded"
+        self._attr_unique_id = f"{self._uid_prefix}_protection_status"
+        self._cached_bitmasks = None
+        self._update_from_battery()
+
+    def _update_from_battery(self) -> None:
+        """Decode the protection bitmasks once per coordinator update."""
+        protection = self._protection_dict()
+        if not protection:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = _EMPTY
+            self._cached_bitmasks = None
+            return
+
+        bitmasks = _PROTECTION_WORDS(protection)
+        # Protection bitmasks rarely change between polls, so keep the last state and attributes
+        if bitmasks == self._cached_bitmasks:
+            return
+        self._cached_bitmasks = bitmasks
+
+        decoded = self._battery_dict["protection_decoded"]
+        attributes = {}
+        for key, bitmask, (raw_key, decoded_key) in zip(protection_definitions, bitmasks, _PROTECTION_ATTR_KEYS):
+            attributes[raw_key] = _hex16(bitmask)
+            attributes[decoded_key] = decoded[key] or "None"
+
+        self._attr_native_value = " ".join([f"{bitmask:04X}" for bitmask in bitmasks])
+        self._attr_extra_state_attributes = attributes
+
+
+# Per-battery sensors built by _build_battery_entities.
+# (sensor class, data_key, friendly name[, unit])
+_PER_BATTERY_KEYED_SENSORS = (
+    (AntraVoltageSensor, "voltage", "Pack Voltage", UnitOfElectricPotential.VOLT),
+    # Additional voltage sensors for descriptive fields (reuse the same voltage sensor class)
+    (AntraVoltageSensor, "max_cell_voltage", "Max Cell Voltage", "mV"),
+    (AntraVoltageSensor, "min_cell_voltage", "Min Cell Voltage", "mV"),
+    (AntraVoltageSensor, "average_cell_voltage", "Average Cell Voltage", "mV"),
+    (AntraCapacitySensor, "total_charge", "Total Charge"),
+    (AntraCapacitySensor, "total_discharge", "Total Discharge"),
+    *((AntraNumberSensor, data_key, friendly_name) for data_key, friendly_name in unknown_fields),
+)
 
-    @property
-    def native_value(self):
-        """Return the decoded protection status as a list of affected cells."""
-        if self.available:
-            data = self.coordinator.data[self._battery_num]
-            protection = data.get("protection", {})
-            raw_val = protection.get(self._protection_key)
-            if raw_val is not None:
-                try:
-                    bitmask = int(str(raw_val).replace(",", ""))
-                    return decode_bitmask(bitmask) or "None"
-                except ValueError:
-                    return None
-        return None
\ No newline at end of file
+# Sensors that only take (coordinator, battery_num)
+_PER_BATTERY_FIXED_SENSORS = (
+    AntraCurrentSensor,
+    AntraAmbientTemperatureSensor,
+    AntraPackAvgTemperatureSensor,
+    AntraMOSTemperatureSensor,
+    AntraSocSensor,
+    AntraInternalResistanceSensor,
+    AntraSOHSensor,
+    AntraFullCapacitySensor,
+    AntraRemainingCapacitySensor,
+    AntraCycleCountSensor,
+    # Status words (voltage, current, temperature, alarm, FET) and the
+    # per-cell protection bitmasks, each combined into a single entity
+    AntraStatusAggregateSensor,
+    AntraProtectionAggregateSensor,
+)
@@ -0,0 +1 @@
+"""Tests for the Antra BMS Monitor integration."""
@@ -0,0 +1,42 @@
+"""Tests for the publish throttling in the Antra sensors."""
+import pytest
+
+from custom_components.antra_bms_monitor.sensor import (
+    AntraCellVoltageSensor,
+    AntraCurrentSensor,
+)
+
+
+def _published_sensor(sensor_class, value):
+    """Return a sensor that has just published value."""
+    # Only the throttling state is needed, so skip the coordinator setup
+    sensor = sensor_class.__new__(sensor_class)
+    sensor._attr_available = True
+    sensor._attr_native_value = value
+    sensor._last_published = None
+    sensor._last_published_available = None
+    sensor._last_publish_time = 0.0
+    assert sensor._should_publish()
+    return sensor
+
+
+@pytest.mark.parametrize(
+    ("sensor_class", "last", "value"),
+    [
+        # Values scaled the way the coordinator scales them (mV / 1000, cA / 100)
+        (AntraCellVoltageSensor, 3000 / 1000, 3010 / 1000),
+        (AntraCellVoltageSensor, 3010 / 1000, 3000 / 1000),
+        (AntraCurrentSensor, -280 / 100, -270 / 100),
+        (AntraCurrentSensor, -170 / 100, -160 / 100),
+    ],
+)
+def test_threshold_sized_step_publishes(sensor_class, last, value):
+    sensor = _published_sensor(sensor_class, last)
+    sensor._attr_native_value = value
+    assert sensor._should_publish()
+
+
+def test_smaller_step_is_held_back():
+    sensor = _published_sensor(AntraCellVoltageSensor, 3000 / 1000)
+    sensor._attr_native_value = 3005 / 1000
+    assert not sensor._should_publish()